@@ -1,4 +1,5 @@
 from .base import Embedder, EmbedderOptionsT
+from .cached import CachedEmbedder
 from .litellm import LiteLLMEmbedder
 from .noop import NoopEmbedder
 from .sparse import BagOfTokens, SparseEmbedder, SparseEmbedderOptionsT
@@ -6,6 +7,7 @@ from .sparse import BagOfTokens, SparseEmbedder, SparseEmbedderOptionsT
 __all__ = [
     "BagOfTokens",
     "BagOfTokens",
+    "CachedEmbedder",
     "Embedder",
     "EmbedderOptionsT",
     "LiteLLMEmbedder",
@@ -0,0 +1,156 @@
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+from typing_extensions import Self
+
+from ragbits.core.audit import trace
+from ragbits.core.embeddings.base import Embedder
+from ragbits.core.options import Options
+from ragbits.core.utils.config_handling import ObjectConstructionConfig
+
+
+class CachedEmbedder(Embedder[Options]):
+    """
+    Embedder wrapper that caches text embeddings in a local SQLite database. Each text is keyed by
+    a content hash of the text, the wrapped embedder's model, its default options and the call options,
+    so only the texts that were not embedded before are sent to the wrapped embedder.
+    """
+
+    options_cls = Options
+
+    def __init__(
+        self,
+        embedder: Embedder,
+        cache_path: str | Path = ":memory:",
+        namespace: str | None = None,
+        default_options: Options | None = None,
+    ) -> None:
+        """
+        Constructs a new CachedEmbedder instance.
+
+        Args:
+            embedder: The embedder used to create embeddings missing from the cache.
+            cache_path: Path to the SQLite database file. Defaults to an in-memory database.
+            namespace: The namespace of the cache keys. Defaults to the class and model name of the wrapped embedder.
+            default_options: The default options for the component.
+        """
+        super().__init__(default_options=default_options)
+        self.embedder = embedder
+        self.cache_path = cache_path
+        self.namespace = namespace or self._default_namespace(embedder)
+        self._embedder_options_repr = self._options_repr(embedder.default_options)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(cache_path), check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector TEXT)")
+
+    def __reduce__(self) -> tuple[Callable, tuple]:
+        """
+        Enables the CachedEmbedder to be pickled and unpickled.
+
+        Returns:
+            The tuple of function and its arguments that allows reconstruction of the CachedEmbedder.
+        """
+        return (self.__class__, (self.embedder, self.cache_path, self.namespace, self.default_options))
+
+    @staticmethod
+    def _default_namespace(embedder: Embedder) -> str:
+        model = getattr(embedder, "model_name", None) or getattr(embedder, "model", None)
+        model_name = model if isinstance(model, str) else ""
+        return f"{type(embedder).__qualname__}:{model_name}"
+
+    @staticmethod
+    def _options_repr(options: Options) -> str:
+        return repr(sorted(options.dict().items()))
+
+    def _key(self, text: str, options: Options) -> str:
+        key = f"{self.namespace}\0{self._embedder_options_repr}\0{self._options_repr(options)}\0{text}"
+        return hashlib.blake2b(key.encode()).hexdigest()
+
+    def _get(self, keys: list[str]) -> dict[str, list[float]]:
+        placeholders = ",".join("?" * len(keys))
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",  # noqa: S608
+                keys,
+            ).fetchall()
+        return {key: json.loads(vector) for key, vector in rows}
+
+    def _set(self, items: dict[str, list[float]]) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                [(key, json.dumps(vector)) for key, vector in items.items()],
+            )
+
+    async def embed_text(self, data: list[str], options: Options | None = None) -> list[list[float]]:
+        """
+        Creates embeddings for the given strings, using cached embeddings where available.
+
+        Args:
+            data: List of strings to get embeddings for.
+            options: Additional settings passed to the wrapped embedder.
+
+        Returns:
+            List of embeddings for the given strings.
+        """
+        merged_options = (self.default_options | options) if options else self.default_options
+        with trace(
+            data=data, namespace=self.namespace, cache_path=str(self.cache_path), options=merged_options.dict()
+        ) as outputs:
+            keys = [self._key(text, merged_options) for text in data]
+            cached = await asyncio.to_thread(self._get, list(set(keys))) if keys else {}
+
+            missing = {key: text for key, text in zip(keys, data, strict=True) if key not in cached}
+            if missing:
+                vectors = await self.embedder.embed_text(list(missing.values()), merged_options)
+                computed = dict(zip(missing.keys(), vectors, strict=True))
+                await asyncio.to_thread(self._set, computed)
+                cached.update(computed)
+
+            outputs.cache_hits = len(data) - len(missing)
+            outputs.embeddings = [cached[key] for key in keys]
+        return outputs.embeddings
+
+    def image_support(self) -> bool:
+        """
+        Check if the wrapped embedder supports image embeddings.
+
+        Returns:
+            True if the wrapped embedder supports image embeddings, False otherwise.
+        """
+        return self.embedder.image_support()
+
+    async def embed_image(self, images: list[bytes], options: Options | None = None) -> list[list[float]]:
+        """
+        Creates embeddings for the given images. Image embeddings are not cached.
+
+        Args:
+            images: List of images to get embeddings for.
+            options: Additional settings passed to the wrapped embedder.
+
+        Returns:
+            List of embeddings for the given images.
+        """
+        merged_options = (self.default_options | options) if options else self.default_options
+        return await self.embedder.embed_image(images, merged_options)
+
+    @classmethod
+    def from_config(cls, config: dict) -> Self:
+        """
+        Initializes the class with the provided configuration.
+
+        Args:
+            config: A dictionary containing configuration details for the class.
+
+        Returns:
+            An instance of the class initialized with the provided configuration.
+        """
+        embedder_config = config.pop("embedder")
+        embedder: Embedder = Embedder.subclass_from_config(ObjectConstructionConfig.model_validate(embedder_config))
+        return super().from_config({**config, "embedder": embedder})
@@ -1,3 +1,4 @@
+import asyncio
 from collections.abc import Callable
 
 from fastembed import SparseTextEmbedding, TextEmbedding
@@ -59,10 +60,16 @@ class FastEmbedEmbedder(Embedder[FastEmbedOptions]):
         with trace(
             data=data, model_name=self.model_name, model=repr(self._model), options=merged_options.dict()
         ) as outputs:
-            embeddings = [[float(x) for x in result] for result in self._model.embed(data, **merged_options.dict())]
+            embeddings = await asyncio.to_thread(self._embed, data, merged_options)
             outputs.embeddings = embeddings
         return embeddings
 
+    def _embed(self, data: list[str], options: FastEmbedOptions) -> list[list[float]]:
+        """
+        Runs the model synchronously. Called in a separate thread, so that the event loop is not blocked.
+        """
+        return [[float(x) for x in result] for result in self._model.embed(data, **options.dict())]
+
 
 class FastEmbedSparseEmbedder(SparseEmbedder[FastEmbedOptions]):
     """
@@ -106,8 +113,14 @@ class FastEmbedSparseEmbedder(SparseEmbedder[FastEmbedOptions]):
         with trace(
             data=data, model_name=self.model_name, model=repr(self._model), options=merged_options.dict()
         ) as outputs:
-            outputs.embeddings = [
-                SparseVector(values=[float(x) for x in result.values], indices=[int(x) for x in result.indices])
-                for result in self._model.embed(data, **merged_options.dict())
-            ]
+            outputs.embeddings = await asyncio.to_thread(self._embed, data, merged_options)
         return outputs.embeddings
+
+    def _embed(self, data: list[str], options: FastEmbedOptions) -> list[SparseVector]:
+        """
+        Runs the model synchronously. Called in a separate thread, so that the event loop is not blocked.
+        """
+        return [
+            SparseVector(values=[float(x) for x in result.values], indices=[int(x) for x in result.indices])
+            for result in self._model.embed(data, **options.dict())
+        ]
@@ -1,3 +1,4 @@
+import asyncio
 from collections.abc import Iterator
 
 from ragbits.core.audit import trace
@@ -80,23 +81,30 @@ class LocalEmbedder(Embedder[LocalEmbedderOptions]):
         ) as outputs:
             embeddings = []
             for batch in self._batch(data, merged_options.batch_size):
-                batch_dict = self.tokenizer(
-                    batch,
-                    max_length=self.tokenizer.model_max_length,
-                    padding=True,
-                    truncation=True,
-                    return_tensors="pt",
-                ).to(self.device)
-                with torch.no_grad():
-                    model_outputs = self.model(**batch_dict)
-                    batch_embeddings = self._average_pool(model_outputs.last_hidden_state, batch_dict["attention_mask"])
-                    batch_embeddings = F.normalize(batch_embeddings, p=2, dim=1)
-                embeddings.extend(batch_embeddings.to("cpu").tolist())
+                embeddings.extend(await asyncio.to_thread(self._embed_batch, batch))
 
             torch.cuda.empty_cache()
             outputs.embeddings = embeddings
         return embeddings
 
+    def _embed_batch(self, batch: list[str]) -> list[list[float]]:
+        """
+        Runs the model synchronously on a single batch. Called in a separate thread, so that the event loop
+        is not blocked (e.g. vector store uploads can progress while the model is running).
+        """
+        batch_dict = self.tokenizer(
+            batch,
+            max_length=self.tokenizer.model_max_length,
+            padding=True,
+            truncation=True,
+            return_tensors="pt",
+        ).to(self.device)
+        with torch.no_grad():
+            model_outputs = self.model(**batch_dict)
+            batch_embeddings = self._average_pool(model_outputs.last_hidden_state, batch_dict["attention_mask"])
+            batch_embeddings = F.normalize(batch_embeddings, p=2, dim=1)
+        return batch_embeddings.to("cpu").tolist()
+
     @staticmethod
     def _batch(data: list[str], batch_size: int) -> Iterator[list[str]]:
         length = len(data)
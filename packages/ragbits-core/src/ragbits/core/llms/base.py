@@ -1,7 +1,10 @@
+import asyncio
 import enum
+import weakref
 from abc import ABC, abstractmethod
 from collections.abc import AsyncGenerator
-from typing import ClassVar, Generic, TypeVar, cast, overload
+from contextlib import nullcontext
+from typing import Any, ClassVar, Generic, TypeVar, cast, overload
 
 from pydantic import BaseModel
 
@@ -48,19 +51,64 @@ class LLM(ConfigurableComponent[LLMClientOptionsT], ABC):
     default_module: ClassVar = llms
     configuration_key: ClassVar = "llm"
 
-    def __init__(self, model_name: str, default_options: LLMClientOptionsT | None = None) -> None:
+    def __init__(
+        self,
+        model_name: str,
+        default_options: LLMClientOptionsT | None = None,
+        concurrency_limit: int | None = 64,
+    ) -> None:
         """
         Constructs a new LLM instance.
 
         Args:
             model_name: Name of the model to be used.
             default_options: Default options to be used.
+            concurrency_limit: Maximum number of requests sent to the model concurrently by this instance.
+                Further requests wait until one of the running ones finishes. None disables the limit.
 
         Raises:
             TypeError: If the subclass is missing the 'options_cls' attribute.
         """
         super().__init__(default_options=default_options)
         self.model_name = model_name
+        self.concurrency_limit = concurrency_limit
+        self._semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Excludes the semaphores, which are bound to event loops, from the pickled state.
+
+        Returns:
+            The state of the instance.
+        """
+        return {**self.__dict__, "_semaphores": None}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """
+        Restores the state of the instance with no semaphores created yet.
+
+        Args:
+            state: The pickled state of the instance.
+        """
+        self.__dict__.update(state)
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    def _get_semaphore(self) -> asyncio.Semaphore | None:
+        """
+        Returns the semaphore limiting concurrent requests in the running event loop. Semaphores are created
+        lazily per event loop, as they can only be used in the loop they were first used in.
+
+        Returns:
+            The semaphore, or None if the concurrency is not limited.
+        """
+        if not self.concurrency_limit:
+            return None
+        loop = asyncio.get_running_loop()
+        if loop not in self._semaphores:
+            self._semaphores[loop] = asyncio.Semaphore(self.concurrency_limit)
+        return self._semaphores[loop]
 
     def __init_subclass__(cls) -> None:
         if not hasattr(cls, "options_cls"):
@@ -102,12 +150,13 @@ class LLM(ConfigurableComponent[LLMClientOptionsT], ABC):
         if isinstance(prompt, str | list):
             prompt = SimplePrompt(prompt)
 
-        return await self._call(
-            prompt=prompt,
-            options=merged_options,
-            json_mode=prompt.json_mode,
-            output_schema=prompt.output_schema(),
-        )
+        async with self._get_semaphore() or nullcontext():
+            return await self._call(
+                prompt=prompt,
+                options=merged_options,
+                json_mode=prompt.json_mode,
+                output_schema=prompt.output_schema(),
+            )
 
     @overload
     async def generate(
@@ -253,14 +302,22 @@ class LLM(ConfigurableComponent[LLMClientOptionsT], ABC):
         if isinstance(prompt, str | list):
             prompt = SimplePrompt(prompt)
 
-        response = await self._call_streaming(
-            prompt=prompt,
-            options=merged_options,
-            json_mode=prompt.json_mode,
-            output_schema=prompt.output_schema(),
-        )
-        async for text_piece in response:
-            yield text_piece
+        # The slot is released in `finally`, so it is also freed when the caller closes the stream early.
+        semaphore = self._get_semaphore()
+        if semaphore:
+            await semaphore.acquire()
+        try:
+            response = await self._call_streaming(
+                prompt=prompt,
+                options=merged_options,
+                json_mode=prompt.json_mode,
+                output_schema=prompt.output_schema(),
+            )
+            async for text_piece in response:
+                yield text_piece
+        finally:
+            if semaphore:
+                semaphore.release()
 
     @abstractmethod
     async def _call(
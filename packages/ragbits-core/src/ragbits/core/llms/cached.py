@@ -0,0 +1,227 @@
+import asyncio
+import hashlib
+import json
+from collections import OrderedDict
+from collections.abc import AsyncGenerator
+from typing import Any
+from uuid import NAMESPACE_OID, uuid5
+
+from pydantic import BaseModel
+from typing_extensions import Self
+
+from ragbits.core.audit import trace
+from ragbits.core.llms.base import LLM
+from ragbits.core.options import Options
+from ragbits.core.prompt.base import BasePrompt
+from ragbits.core.utils.config_handling import ObjectConstructionConfig
+from ragbits.core.vector_stores.base import VectorStore, VectorStoreEntry, VectorStoreOptions
+
+
+class CachedLLM(LLM[Options]):
+    """
+    LLM wrapper that caches responses of the wrapped LLM.
+
+    Responses are reused for requests identical to the previous ones (same conversation, options and output
+    schema), including the ones still in flight. If a vector store is provided, responses are also reused for
+    requests whose last user message is semantically similar to a cached one, as long as the rest of the request
+    is identical.
+    """
+
+    options_cls = Options
+
+    def __init__(
+        self,
+        llm: LLM,
+        vector_store: VectorStore | None = None,
+        max_distance: float = 0.03,
+        max_size: int = 1024,
+        default_options: Options | None = None,
+    ) -> None:
+        """
+        Constructs a new CachedLLM instance.
+
+        Args:
+            llm: The LLM whose responses are cached.
+            vector_store: The vector store used to find semantically similar requests. If not provided,
+                only identical requests are served from the cache.
+            max_distance: The maximum distance between the last user messages of similar requests,
+                as measured by the vector store.
+            max_size: The maximum number of responses kept for identical requests.
+            default_options: Default options passed to the wrapped LLM.
+        """
+        super().__init__(llm.model_name, default_options, concurrency_limit=None)
+        self.llm = llm
+        self.vector_store = vector_store
+        self.max_distance = max_distance
+        self.max_size = max_size
+        self._responses: OrderedDict[str, dict] = OrderedDict()
+        self._pending: dict[str, asyncio.Future[tuple[dict, bool]]] = {}
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Excludes the requests in flight, which are bound to an event loop, from the pickled state.
+
+        Returns:
+            The state of the instance.
+        """
+        return {**super().__getstate__(), "_pending": {}}
+
+    def count_tokens(self, prompt: BasePrompt) -> int:
+        """
+        Counts tokens in the prompt using the wrapped LLM.
+
+        Args:
+            prompt: Formatted prompt template with conversation and response parsing configuration.
+
+        Returns:
+            Number of tokens in the prompt.
+        """
+        return self.llm.count_tokens(prompt)
+
+    async def _call(
+        self,
+        prompt: BasePrompt,
+        options: Options,
+        json_mode: bool = False,
+        output_schema: type[BaseModel] | dict | None = None,
+    ) -> dict:
+        """
+        Returns the cached response for the request or calls the wrapped LLM and caches its response.
+
+        Args:
+            prompt: Formatted prompt template with conversation.
+            options: Additional settings passed to the wrapped LLM.
+            json_mode: Force the response to be in JSON format.
+            output_schema: Schema for structured response (either Pydantic model or a JSON schema).
+
+        Returns:
+            Response dict from LLM.
+        """
+        chat = prompt.chat
+        query = chat[-1]["content"] if chat and chat[-1].get("role") == "user" else None
+        if not isinstance(query, str):
+            query = None
+
+        request = {
+            "model_name": self.llm.model_name,
+            "options": (self.llm.default_options | options).dict(),
+            "json_mode": json_mode,
+            "output_schema": (output_schema.model_json_schema() if isinstance(output_schema, type) else output_schema),
+        }
+        key = self._hash({**request, "chat": chat})
+        context_key = self._hash({**request, "chat": chat[:-1] if query is not None else chat})
+
+        with trace(model_name=self.model_name, key=key, query=query) as outputs:
+            outputs.cache_hit = True
+            if key in self._responses:
+                self._responses.move_to_end(key)
+                return dict(self._responses[key])
+
+            pending = self._pending.get(key)
+            if pending is None:
+                pending = self._pending[key] = asyncio.ensure_future(
+                    self._fetch(prompt, options, key, context_key, query)
+                )
+                pending.add_done_callback(lambda _: self._pending.pop(key, None))
+                response, outputs.cache_hit = await asyncio.shield(pending)
+            else:
+                response, _ = await asyncio.shield(pending)
+
+        return dict(response)
+
+    async def _fetch(
+        self,
+        prompt: BasePrompt,
+        options: Options,
+        key: str,
+        context_key: str,
+        query: str | None,
+    ) -> tuple[dict, bool]:
+        """
+        Looks up a semantically similar request in the vector store or calls the wrapped LLM, and caches
+        the response for identical requests. The fetch is shared by all identical requests in flight.
+
+        Args:
+            prompt: Formatted prompt template with conversation.
+            options: Additional settings passed to the wrapped LLM.
+            key: The hash of the whole request.
+            context_key: The hash of the request without its last user message.
+            query: The last user message of the request, if any.
+
+        Returns:
+            The response and whether it was found in the vector store.
+        """
+        response = None
+        if self.vector_store and query is not None:
+            results = await self.vector_store.retrieve(query, VectorStoreOptions(k=5, max_distance=self.max_distance))
+            response = next(
+                (
+                    result.entry.metadata["response"]
+                    for result in results
+                    if result.entry.metadata.get("context_key") == context_key
+                ),
+                None,
+            )
+
+        cache_hit = response is not None
+        if response is None:
+            response = await self.llm.generate_raw(prompt, options=options)
+            if self.vector_store and query is not None:
+                await self.vector_store.store(
+                    [
+                        VectorStoreEntry(
+                            id=uuid5(NAMESPACE_OID, key),
+                            text=query,
+                            metadata={"context_key": context_key, "response": response},
+                        )
+                    ]
+                )
+
+        self._responses[key] = response
+        if len(self._responses) > self.max_size:
+            self._responses.popitem(last=False)
+
+        return response, cache_hit
+
+    async def _call_streaming(
+        self,
+        prompt: BasePrompt,
+        options: Options,
+        json_mode: bool = False,
+        output_schema: type[BaseModel] | dict | None = None,
+    ) -> AsyncGenerator[str, None]:
+        """
+        Calls the wrapped LLM with output streaming. Streamed responses are not cached.
+
+        Args:
+            prompt: Formatted prompt template with conversation.
+            options: Additional settings passed to the wrapped LLM.
+            json_mode: Force the response to be in JSON format.
+            output_schema: Schema for structured response (either Pydantic model or a JSON schema).
+
+        Returns:
+            Response stream from LLM.
+        """
+        return self.llm.generate_streaming(prompt, options=options)
+
+    @staticmethod
+    def _hash(data: dict) -> str:
+        return hashlib.blake2b(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+
+    @classmethod
+    def from_config(cls, config: dict) -> Self:
+        """
+        Initializes the class with the provided configuration.
+
+        Args:
+            config: A dictionary containing configuration details for the class.
+
+        Returns:
+            An instance of the class initialized with the provided configuration.
+        """
+        config["llm"] = LLM.subclass_from_config(ObjectConstructionConfig.model_validate(config["llm"]))
+        if "vector_store" in config:
+            config["vector_store"] = VectorStore.subclass_from_config(
+                ObjectConstructionConfig.model_validate(config["vector_store"])
+            )
+        return super().from_config(config)
@@ -57,6 +57,7 @@ class LiteLLM(LLM[LiteLLMOptions]):
         api_version: str | None = None,
         use_structured_output: bool = False,
         router: litellm.Router | None = None,
+        concurrency_limit: int | None = 64,
     ) -> None:
         """
         Constructs a new LiteLLM instance.
@@ -74,8 +75,10 @@ class LiteLLM(LLM[LiteLLMOptions]):
                 [structured output](https://docs.litellm.ai/docs/completion/json_mode#pass-in-json_schema)
                 from the model. Default is False. Can only be combined with models that support structured output.
             router: Router to be used to [route requests](https://docs.litellm.ai/docs/routing) to different models.
+            concurrency_limit: Maximum number of requests sent to the model concurrently by this instance.
+                Further requests wait until one of the running ones finishes. None disables the limit.
         """
-        super().__init__(model_name, default_options)
+        super().__init__(model_name, default_options, concurrency_limit)
         self.base_url = base_url
         self.api_key = api_key
         self.api_version = api_version
@@ -25,15 +25,21 @@ class MockLLM(LLM[MockLLMOptions]):
 
     options_cls = MockLLMOptions
 
-    def __init__(self, model_name: str = "mock", default_options: MockLLMOptions | None = None) -> None:
+    def __init__(
+        self,
+        model_name: str = "mock",
+        default_options: MockLLMOptions | None = None,
+        concurrency_limit: int | None = 64,
+    ) -> None:
         """
         Constructs a new MockLLM instance.
 
         Args:
             model_name: Name of the model to be used.
             default_options: Default options to be used.
+            concurrency_limit: Maximum number of requests handled concurrently. None disables the limit.
         """
-        super().__init__(model_name, default_options=default_options)
+        super().__init__(model_name, default_options=default_options, concurrency_limit=concurrency_limit)
         self.calls: list[ChatFormat] = []
 
     async def _call(  # noqa: PLR6301
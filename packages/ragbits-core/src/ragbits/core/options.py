@@ -4,7 +4,7 @@ from typing import Any, ClassVar, TypeVar
 from pydantic import BaseModel, ConfigDict
 from typing_extensions import Self
 
-from ragbits.core.types import NotGiven
+from ragbits.core.types import NOT_GIVEN
 
 OptionsT = TypeVar("OptionsT", bound="Options")
 
@@ -22,18 +22,22 @@ class Options(BaseModel, ABC):
         """
         Merges two Options, prioritizing non-NOT_GIVEN values from the 'other' object.
         """
-        self_dict = self.model_dump()
-        other_dict = other.model_dump()
-
-        updated_dict = {
-            key: other_dict[key]
-            if not isinstance(other_dict.get(key), NotGiven) and key in other_dict
-            else self_dict[key]
-            for key in self_dict.keys() | other_dict.keys()
-        }
+        updated_dict = self._values() | {key: value for key, value in other._values().items() if value is not NOT_GIVEN}
 
         return self.__class__(**updated_dict)
 
+    def _values(self) -> dict[str, Any]:
+        """
+        Collects the values of all fields, including the extra ones, without the copying done by `model_dump`.
+
+        Returns:
+            A dictionary mapping field names to their values.
+        """
+        values = {name: getattr(self, name) for name in type(self).model_fields}
+        if self.__pydantic_extra__:
+            values.update(self.__pydantic_extra__)
+        return values
+
     def dict(self) -> dict[str, Any]:  # type: ignore # mypy complains about overriding BaseModel.dict
         """
         Creates a dictionary representation of the Options instance.
@@ -42,9 +46,7 @@ class Options(BaseModel, ABC):
         Returns:
             A dictionary representation of the Options instance.
         """
-        options = self.model_dump()
-
         return {
-            key: self._not_given if value is None or isinstance(value, NotGiven) else value
-            for key, value in options.items()
+            key: self._not_given if value is None or value is NOT_GIVEN else value
+            for key, value in self._values().items()
         }
@@ -1,4 +1,4 @@
-from typing import Literal
+from typing import ClassVar, Literal
 
 from typing_extensions import override
 
@@ -19,8 +19,21 @@ class NotGiven:
     get(timeout=None)  # No timeout
     get()  # Default timeout behavior, which may not be statically known at the method definition.
     ```
+
+    All instances are the same object (also after copying or unpickling), so values can be checked
+    with `value is NOT_GIVEN`.
     """
 
+    _instance: ClassVar["NotGiven | None"] = None
+
+    def __new__(cls) -> "NotGiven":
+        """
+        Returns the single instance of the class.
+        """
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
     def __bool__(self) -> Literal[False]:
         return False
 
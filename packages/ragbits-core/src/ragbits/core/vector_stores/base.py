@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from enum import Enum
 from typing import ClassVar, TypeVar
@@ -43,12 +44,12 @@ class VectorStoreEntry(BaseModel):
 class VectorStoreResult(BaseModel):
     """
     An object representing a query result from a vector store.
-    Contains the entry, its vector, and the similarity score.
+    Contains the entry, its vector (if requested with `include_vectors`), and the similarity score.
     """
 
     entry: VectorStoreEntry
-    vector: list[float]
     score: float
+    vector: list[float] | None = None
 
 
 class VectorStoreOptions(Options):
@@ -58,6 +59,7 @@ class VectorStoreOptions(Options):
 
     k: int = 5
     max_distance: float | None = None
+    include_vectors: bool = False
 
 
 VectorStoreOptionsT = TypeVar("VectorStoreOptionsT", bound=VectorStoreOptions)
@@ -98,6 +100,25 @@ class VectorStore(ConfigurableComponent[VectorStoreOptionsT], ABC):
             The entries.
         """
 
+    async def retrieve_batch(
+        self,
+        texts: list[str],
+        options: VectorStoreOptionsT | None = None,
+    ) -> list[list[VectorStoreResult]]:
+        """
+        Retrieve entries from the vector store most similar to each of the provided texts.
+        By default, the queries are run concurrently. Vector stores supporting batch queries
+        can override this method to embed and query all texts at once.
+
+        Args:
+            texts: The texts to query the vector store with.
+            options: The options for querying the vector store, shared by all queries.
+
+        Returns:
+            The entries, one list per query text, in the same order as the texts.
+        """
+        return list(await asyncio.gather(*(self.retrieve(text, options) for text in texts)))
+
     @abstractmethod
     async def remove(self, ids: list[UUID]) -> None:
         """
@@ -163,6 +184,7 @@ class VectorStoreWithExternalEmbedder(VectorStore[VectorStoreOptionsT]):
     async def _create_embeddings(self, entries: list[VectorStoreEntry]) -> dict[UUID, list[float]]:
         """
         Create embeddings for the given entry, using the provided embedder and embedding type.
+        Entries sharing the same text are embedded only once.
 
         Args:
             entries: The entries to create embeddings for.
@@ -172,8 +194,10 @@ class VectorStoreWithExternalEmbedder(VectorStore[VectorStoreOptionsT]):
         """
         if self._embedding_type == EmbeddingType.TEXT:
             entries = [e for e in entries if e.text is not None]
-            embeddings = await self._embedder.embed_text([e.text for e in entries if e.text is not None])
-            return {e.id: v for e, v in zip(entries, embeddings, strict=True)}
+            unique_texts = list(dict.fromkeys(e.text for e in entries if e.text is not None))
+            embeddings = await self._embedder.embed_text(unique_texts)
+            text_embeddings = dict(zip(unique_texts, embeddings, strict=True))
+            return {e.id: text_embeddings[e.text] for e in entries if e.text is not None}
         elif self._embedding_type == EmbeddingType.IMAGE:
             entries = [e for e in entries if e.image_bytes is not None]
             embeddings = await self._embedder.embed_image([e.image_bytes for e in entries if e.image_bytes is not None])
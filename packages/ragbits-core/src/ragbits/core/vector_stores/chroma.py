@@ -171,16 +171,20 @@ class ChromaVectorStore(VectorStoreWithExternalEmbedder[VectorStoreOptions]):
                 n_results=merged_options.k,
                 include=[
                     types.IncludeEnum.metadatas,
-                    types.IncludeEnum.embeddings,
                     types.IncludeEnum.distances,
                     types.IncludeEnum.documents,
+                    *([types.IncludeEnum.embeddings] if merged_options.include_vectors else []),
                 ],
             )
 
             ids = [id for batch in results.get("ids", []) for id in batch]
             distances = [distance for batch in results.get("distances") or [] for distance in batch]
             documents = [document for batch in results.get("documents") or [] for document in batch]
-            embeddings = [embedding for batch in results.get("embeddings") or [] for embedding in batch]
+            embeddings = (
+                [embedding for batch in results.get("embeddings") or [] for embedding in batch]
+                if merged_options.include_vectors
+                else [None] * len(ids)
+            )
 
             metadatas: Sequence = [dict(metadata) for batch in results.get("metadatas") or [] for metadata in batch]
 
@@ -89,7 +89,11 @@ class InMemoryVectorStore(VectorStoreWithExternalEmbedder[VectorStoreOptions]):
 
             for entry_id, vector in self._embeddings.items():
                 distance = float(np.linalg.norm(np.array(vector) - np.array(query_vector)))
-                result = VectorStoreResult(entry=self._entries[entry_id], vector=vector, score=distance)
+                result = VectorStoreResult(
+                    entry=self._entries[entry_id],
+                    vector=vector if merged_options.include_vectors else None,
+                    score=distance,
+                )
                 if merged_options.max_distance is None or result.score <= merged_options.max_distance:
                     results.append(result)
 
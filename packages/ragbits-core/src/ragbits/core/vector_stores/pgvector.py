@@ -119,8 +119,10 @@ class PgVectorStore(VectorStoreWithExternalEmbedder[VectorStoreOptions]):
         if not query_options:
             query_options = self.default_options
 
+        # Vectors are only selected when requested, as they dominate the size of the results.
+        columns = "*" if query_options.include_vectors else "id, key, metadata"
         # _table_name has been validated in the class constructor, and it is a valid table name.
-        query = f"SELECT *, vector {distance_operator} $1 as distance FROM {self._table_name}"  # noqa S608
+        query = f"SELECT {columns}, vector {distance_operator} $1 as distance FROM {self._table_name}"  # noqa S608
 
         values: list[Any] = [str(vector)]
 
@@ -353,7 +355,7 @@ class PgVectorStore(VectorStoreWithExternalEmbedder[VectorStoreOptions]):
                             text=record["key"],
                             metadata=json.loads(record["metadata"]),
                         ),
-                        vector=json.loads(record["vector"]),
+                        vector=json.loads(record["vector"]) if query_options.include_vectors else None,
                         score=record["distance"],
                     )
                     for record in results
@@ -1,10 +1,13 @@
+import asyncio
 import contextlib
 from collections.abc import Callable
+from functools import lru_cache
 from typing import cast
 from uuid import UUID
 
 import httpx
 import qdrant_client
+from pydantic import TypeAdapter
 from qdrant_client import AsyncQdrantClient, models
 from qdrant_client.models import Distance, FieldCondition, Filter, MatchValue, VectorParams
 from typing_extensions import Self
@@ -13,6 +16,7 @@ from ragbits.core.audit import trace
 from ragbits.core.embeddings.base import Embedder
 from ragbits.core.utils.config_handling import ObjectConstructionConfig, import_by_path
 from ragbits.core.utils.dict_transformations import flatten_dict
+from ragbits.core.utils.pydantic import _pydantic_hex_to_bytes
 from ragbits.core.vector_stores.base import (
     EmbeddingType,
     VectorStoreEntry,
@@ -23,6 +27,39 @@ from ragbits.core.vector_stores.base import (
     WhereQuery,
 )
 
+DEFAULT_CLIENT_LIMITS = {
+    "max_connections": 1000,
+    "max_keepalive_connections": 200,
+    "keepalive_expiry": 30,
+}
+
+_ENTRY_LIST_ADAPTER = TypeAdapter(list[VectorStoreEntry])
+
+
+@lru_cache(maxsize=128)
+def _qdrant_filter_template(keys: tuple[str, ...]) -> Callable[[tuple], Filter]:
+    """
+    Creates a builder of QdrantFilters for WhereQueries with the given flattened keys. Builders are cached
+    per keys, so only the matched values are validated when the same filter shape is used repeatedly.
+
+    Args:
+        keys: The flattened keys of the WhereQuery.
+
+    Returns:
+        The function creating the filter from the values matching the keys.
+    """
+    field_keys = [f"metadata.{key}" for key in keys]
+
+    def build(values: tuple) -> Filter:
+        return Filter(
+            must=[
+                FieldCondition.model_construct(key=key, match=MatchValue(value=cast(str | int | bool, value)))
+                for key, value in zip(field_keys, values, strict=True)
+            ]
+        )
+
+    return build
+
 
 class QdrantVectorStore(VectorStoreWithExternalEmbedder[VectorStoreOptions]):
     """
@@ -39,6 +76,11 @@ class QdrantVectorStore(VectorStoreWithExternalEmbedder[VectorStoreOptions]):
         embedding_type: EmbeddingType = EmbeddingType.TEXT,
         distance_method: Distance = Distance.COSINE,
         default_options: VectorStoreOptions | None = None,
+        upload_batch_size: int = 256,
+        upload_max_concurrency: int = 4,
+        strict_validation: bool = False,
+        vector_datatype: models.Datatype | None = None,
+        quantization_config: models.QuantizationConfig | None = None,
     ) -> None:
         """
         Constructs a new QdrantVectorStore instance.
@@ -50,6 +92,15 @@ class QdrantVectorStore(VectorStoreWithExternalEmbedder[VectorStoreOptions]):
             embedding_type: Which part of the entry to embed, either text or image. The other part will be ignored.
             distance_method: The distance metric to use when creating the collection.
             default_options: The default options for querying the vector store.
+            upload_batch_size: The maximum number of points sent to Qdrant in a single upsert request.
+                Batches are uploaded concurrently.
+            upload_max_concurrency: The maximum number of upsert requests sent to Qdrant at the same time.
+            strict_validation: Whether to validate payloads of retrieved points. By default the entries are
+                constructed without validation, relying on the payloads being written by `store`. Enable it
+                for collections populated by other means.
+            vector_datatype: The datatype of vectors stored in the created collection, e.g. `float16` or `uint8`
+                to reduce the memory and bandwidth used by vectors. Uses the Qdrant default (`float32`) if not set.
+            quantization_config: The quantization config of the created collection, e.g. scalar int8 quantization.
         """
         super().__init__(
             default_options=default_options,
@@ -59,6 +110,12 @@ class QdrantVectorStore(VectorStoreWithExternalEmbedder[VectorStoreOptions]):
         self._client = client
         self._index_name = index_name
         self._distance_method = distance_method
+        self._upload_batch_size = upload_batch_size
+        self._upload_max_concurrency = upload_max_concurrency
+        self._strict_validation = strict_validation
+        self._vector_datatype = vector_datatype
+        self._quantization_config = quantization_config
+        self._collection_ready = False
 
     def __reduce__(self) -> tuple[Callable, tuple]:
         """
@@ -74,6 +131,11 @@ class QdrantVectorStore(VectorStoreWithExternalEmbedder[VectorStoreOptions]):
             embedder: Embedder,
             distance_method: Distance,
             default_options: VectorStoreOptions,
+            upload_batch_size: int,
+            upload_max_concurrency: int,
+            strict_validation: bool,
+            vector_datatype: models.Datatype | None,
+            quantization_config: models.QuantizationConfig | None,
         ) -> QdrantVectorStore:
             return QdrantVectorStore(
                 client=AsyncQdrantClient(**client_params),
@@ -81,6 +143,11 @@ class QdrantVectorStore(VectorStoreWithExternalEmbedder[VectorStoreOptions]):
                 embedder=embedder,
                 distance_method=distance_method,
                 default_options=default_options,
+                upload_batch_size=upload_batch_size,
+                upload_max_concurrency=upload_max_concurrency,
+                strict_validation=strict_validation,
+                vector_datatype=vector_datatype,
+                quantization_config=quantization_config,
             )
 
         return (
@@ -91,6 +158,11 @@ class QdrantVectorStore(VectorStoreWithExternalEmbedder[VectorStoreOptions]):
                 self._embedder,
                 self._distance_method,
                 self.default_options,
+                self._upload_batch_size,
+                self._upload_max_concurrency,
+                self._strict_validation,
+                self._vector_datatype,
+                self._quantization_config,
             ),
         )
 
@@ -99,6 +171,12 @@ class QdrantVectorStore(VectorStoreWithExternalEmbedder[VectorStoreOptions]):
         """
         Initializes the class with the provided configuration.
 
+        The HTTP connection pool limits of the client default to `DEFAULT_CLIENT_LIMITS`, which are higher
+        than the httpx defaults, so that many concurrent requests (e.g. retrieving results for all queries
+        produced by a `MultiQueryRephraser`) are not queued on the pool. Values provided in the `limits` key
+        of the client configuration take precedence. Setting `prefer_grpc` in the client configuration makes
+        the client transfer vectors as packed floats over gRPC instead of JSON arrays.
+
         Args:
             config: A dictionary containing configuration details for the class.
 
@@ -107,9 +185,8 @@ class QdrantVectorStore(VectorStoreWithExternalEmbedder[VectorStoreOptions]):
         """
         client_options = ObjectConstructionConfig.model_validate(config["client"])
         client_cls = import_by_path(client_options.type, qdrant_client)
-        if "limits" in client_options.config:
-            limits = httpx.Limits(**client_options.config["limits"])
-            client_options.config["limits"] = limits
+        limits = httpx.Limits(**(DEFAULT_CLIENT_LIMITS | client_options.config.get("limits", {})))
+        client_options.config["limits"] = limits
         config["client"] = client_cls(**client_options.config)
         return super().from_config(config)
 
@@ -135,27 +212,48 @@ class QdrantVectorStore(VectorStoreWithExternalEmbedder[VectorStoreOptions]):
 
             embeddings: dict = await self._create_embeddings(entries)
 
-            if not await self._client.collection_exists(self._index_name):
+            if not await self._collection_exists():
                 vector_size = len(next(iter(embeddings.values())))
                 await self._client.create_collection(
                     collection_name=self._index_name,
-                    vectors_config=VectorParams(size=vector_size, distance=self._distance_method),
+                    vectors_config=VectorParams(
+                        size=vector_size,
+                        distance=self._distance_method,
+                        datatype=self._vector_datatype,
+                    ),
+                    quantization_config=self._quantization_config,
                 )
-
-            points = (
+                self._collection_ready = True
+
+            embedded_entries = [entry for entry in entries if entry.id in embeddings]
+            # The adapter serializes by the VectorStoreEntry schema, so entries of subclasses are dumped one by one
+            # to keep their extra fields. `serialize_as_any` is not used, as newer pydantic versions skip
+            # the serializer of `image_bytes` with it.
+            payloads = (
+                _ENTRY_LIST_ADAPTER.dump_python(embedded_entries, exclude_none=True)
+                if all(type(entry) is VectorStoreEntry for entry in embedded_entries)
+                else [entry.model_dump(exclude_none=True) for entry in embedded_entries]
+            )
+            points = [
                 models.PointStruct(
                     id=str(entry.id),
                     vector=embeddings[entry.id],
-                    payload=entry.model_dump(exclude_none=True),
+                    payload=payload,
                 )
-                for entry in entries
-                if entry.id in embeddings
-            )
+                for entry, payload in zip(embedded_entries, payloads, strict=True)
+            ]
 
-            self._client.upload_points(
-                collection_name=self._index_name,
-                points=points,
-                wait=True,
+            semaphore = asyncio.Semaphore(self._upload_max_concurrency)
+
+            async def upsert(batch: list[models.PointStruct]) -> None:
+                async with semaphore:
+                    await self._client.upsert(collection_name=self._index_name, points=batch, wait=True)
+
+            await asyncio.gather(
+                *[
+                    upsert(points[i : i + self._upload_batch_size])
+                    for i in range(0, len(points), self._upload_batch_size)
+                ]
             )
 
     async def retrieve(self, text: str, options: VectorStoreOptionsT | None = None) -> list[VectorStoreResult]:
@@ -169,38 +267,63 @@ class QdrantVectorStore(VectorStoreWithExternalEmbedder[VectorStoreOptions]):
         Returns:
             The retrieved entries.
         """
+        return (await self.retrieve_batch([text], options))[0]
+
+    async def retrieve_batch(
+        self, texts: list[str], options: VectorStoreOptionsT | None = None
+    ) -> list[list[VectorStoreResult]]:
+        """
+        Retrieves entries from the Qdrant collection for multiple queries at once. All texts are embedded
+        with a single embedder call and sent to Qdrant in a single batch query request.
+
+        Args:
+            texts: The texts to query the vector store with.
+            options: The options for querying the vector store, shared by all queries.
+
+        Returns:
+            The retrieved entries, one list per query text, in the same order as the texts.
+        """
         merged_options = (self.default_options | options) if options else self.default_options
         score_threshold = 1 - merged_options.max_distance if merged_options.max_distance else None
         with trace(
-            text=text,
+            texts=texts,
             options=merged_options,
             index_name=self._index_name,
             distance_method=self._distance_method,
             embedder=repr(self._embedder),
             embedding_type=self._embedding_type,
         ) as outputs:
-            query_vector = (await self._embedder.embed_text([text]))[0]
+            if not texts:
+                outputs.results = []
+                return outputs.results
 
-            query_results = await self._client.query_points(
+            query_vectors = await self._embedder.embed_text(texts)
+
+            batch_results = await self._client.query_batch_points(
                 collection_name=self._index_name,
-                query=query_vector,
-                limit=merged_options.k,
-                score_threshold=score_threshold,
-                with_payload=True,
-                with_vectors=True,
+                requests=[
+                    models.QueryRequest(
+                        query=query_vector,
+                        limit=merged_options.k,
+                        score_threshold=score_threshold,
+                        with_payload=True,
+                        with_vector=merged_options.include_vectors,
+                    )
+                    for query_vector in query_vectors
+                ],
             )
 
-            outputs.results = []
-            for point in query_results.points:
-                entry = VectorStoreEntry.model_validate(point.payload)
-
-                outputs.results.append(
+            outputs.results = [
+                [
                     VectorStoreResult(
-                        entry=entry,
+                        entry=self._entry_from_payload(cast(dict, point.payload)),
                         score=point.score,
-                        vector=cast(list[float], point.vector),
+                        vector=cast(list[float] | None, point.vector),
                     )
-                )
+                    for point in query_results.points
+                ]
+                for query_results in batch_results
+            ]
 
             return outputs.results
 
@@ -223,6 +346,36 @@ class QdrantVectorStore(VectorStoreWithExternalEmbedder[VectorStoreOptions]):
                 points_selector=models.PointIdsList(points=[str(id) for id in ids]),
             )
 
+    async def _collection_exists(self) -> bool:
+        """
+        Checks whether the collection exists. Once the collection is known to exist, the check is skipped
+        on subsequent calls to save a round-trip to Qdrant.
+
+        Returns:
+            True if the collection exists, False otherwise.
+        """
+        if not self._collection_ready:
+            self._collection_ready = await self._client.collection_exists(collection_name=self._index_name)
+        return self._collection_ready
+
+    def _entry_from_payload(self, payload: dict) -> VectorStoreEntry:
+        """
+        Creates the VectorStoreEntry from the payload of a point.
+
+        Args:
+            payload: The payload of the point, as written by `store`.
+
+        Returns:
+            The entry.
+        """
+        if self._strict_validation:
+            return VectorStoreEntry.model_validate(payload)
+
+        values = {**payload, "id": UUID(str(payload["id"]))}
+        if values.get("image_bytes") is not None:
+            values["image_bytes"] = _pydantic_hex_to_bytes(values["image_bytes"])
+        return VectorStoreEntry.model_construct(**values)
+
     @staticmethod
     def _create_qdrant_filter(where: WhereQuery) -> Filter:
         """
@@ -235,13 +388,8 @@ class QdrantVectorStore(VectorStoreWithExternalEmbedder[VectorStoreOptions]):
             The created filter.
         """
         where = flatten_dict(where)  # type: ignore
-
-        return Filter(
-            must=[
-                FieldCondition(key=f"metadata.{key}", match=MatchValue(value=cast(str | int | bool, value)))
-                for key, value in where.items()
-            ]
-        )
+        filter_template = _qdrant_filter_template(tuple(where.keys()))
+        return filter_template(tuple(where.values()))
 
     async def list(
         self,
@@ -265,8 +413,7 @@ class QdrantVectorStore(VectorStoreWithExternalEmbedder[VectorStoreOptions]):
             MetadataNotFoundError: If the metadata is not found.
         """
         with trace(where=where, index_name=self._index_name, limit=limit, offset=offset) as outputs:
-            collection_exists = await self._client.collection_exists(collection_name=self._index_name)
-            if not collection_exists:
+            if not await self._collection_exists():
                 return []
 
             limit = limit or (await self._client.count(collection_name=self._index_name)).count
@@ -279,9 +426,9 @@ class QdrantVectorStore(VectorStoreWithExternalEmbedder[VectorStoreOptions]):
                 limit=limit,
                 offset=offset,
                 with_payload=True,
-                with_vectors=True,
+                with_vectors=False,
             )
 
-            outputs.results = [VectorStoreEntry.model_validate(point.payload) for point in results.points]
+            outputs.results = [self._entry_from_payload(cast(dict, point.payload)) for point in results.points]
 
             return outputs.results
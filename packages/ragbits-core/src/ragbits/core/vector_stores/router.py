@@ -0,0 +1,211 @@
+import asyncio
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable, Sequence
+from typing import Any
+from uuid import UUID
+
+from ragbits.core.audit import traceable
+from ragbits.core.types import NOT_GIVEN
+from ragbits.core.vector_stores.base import (
+    VectorStore,
+    VectorStoreEntry,
+    VectorStoreOptions,
+    VectorStoreResult,
+    WhereQuery,
+)
+
+
+class MultiCollectionRouter(VectorStore[VectorStoreOptions]):
+    """
+    A vector store that routes requests to vector stores of multiple collections. Queries of a batch are grouped
+    by the collection they target, so each collection is queried at most once per batch (e.g. one
+    `query_batch_points` request per collection for Qdrant), instead of once per query.
+    """
+
+    options_cls = VectorStoreOptions
+
+    def __init__(
+        self,
+        collections: Sequence[str],
+        store_factory: Callable[[str], VectorStore],
+        query_router: Callable[[str], str],
+        entry_router: Callable[[VectorStoreEntry], str],
+        max_cached_stores: int = 8,
+        default_options: VectorStoreOptions | None = None,
+    ) -> None:
+        """
+        Constructs a new MultiCollectionRouter instance.
+
+        Args:
+            collections: The names of all collections handled by the router.
+            store_factory: The function creating the vector store of the collection with the given name.
+                The created stores should be lightweight handles over persistent storage (e.g. QdrantVectorStores
+                sharing a single client), as they can be evicted from the cache and created again.
+            query_router: The function classifying the query text into the name of the collection to query.
+            entry_router: The function choosing the name of the collection in which the entry is stored.
+            max_cached_stores: The maximum number of recently used vector stores kept in the cache.
+            default_options: The default options for querying the vector stores. Only the explicitly set options
+                are applied, the other ones fall back to the default options of the collection's vector store.
+        """
+        super().__init__(default_options)
+        self.collections = list(collections)
+        self.store_factory = store_factory
+        self.query_router = query_router
+        self.entry_router = entry_router
+        self.max_cached_stores = max_cached_stores
+        self._stores: OrderedDict[str, VectorStore] = OrderedDict()
+
+    def _get_store(self, collection: str) -> VectorStore:
+        """
+        Returns the vector store of the collection, reusing recently used stores.
+
+        Args:
+            collection: The name of the collection.
+
+        Returns:
+            The vector store of the collection.
+
+        Raises:
+            ValueError: If the collection is not handled by the router.
+        """
+        if collection in self._stores:
+            self._stores.move_to_end(collection)
+            return self._stores[collection]
+
+        if collection not in self.collections:
+            raise ValueError(f"Collection {collection!r} is not handled by the router")
+
+        store = self._stores[collection] = self.store_factory(collection)
+        if len(self._stores) > self.max_cached_stores:
+            self._stores.popitem(last=False)
+        return store
+
+    def _merge_options(self, options: VectorStoreOptions | None) -> VectorStoreOptions | None:
+        """
+        Merges the explicitly set default options of the router with the provided options. The options not set
+        explicitly are left as NOT_GIVEN, so they don't override the default options of the vector stores.
+
+        Args:
+            options: The options provided by the caller.
+
+        Returns:
+            The options to pass to the vector store.
+        """
+        if not self.default_options.model_fields_set:
+            return options
+
+        values: dict[str, Any] = {name: NOT_GIVEN for name in self.options_cls.model_fields}
+        values |= {name: getattr(self.default_options, name) for name in self.default_options.model_fields_set}
+        router_options = self.options_cls.model_construct(**values)
+        return (router_options | options) if options else router_options
+
+    @traceable
+    async def store(self, entries: list[VectorStoreEntry]) -> None:
+        """
+        Store entries in the vector stores of the collections chosen by the entry router.
+
+        Args:
+            entries: The entries to store.
+        """
+        entries_by_collection: defaultdict[str, list[VectorStoreEntry]] = defaultdict(list)
+        for entry in entries:
+            entries_by_collection[self.entry_router(entry)].append(entry)
+
+        await asyncio.gather(
+            *(
+                self._get_store(collection).store(collection_entries)
+                for collection, collection_entries in entries_by_collection.items()
+            )
+        )
+
+    @traceable
+    async def retrieve(
+        self,
+        text: str,
+        options: VectorStoreOptions | None = None,
+    ) -> list[VectorStoreResult]:
+        """
+        Retrieve entries most similar to the provided text from the collection chosen by the query router.
+
+        Args:
+            text: The text to query the vector store with.
+            options: The options for querying the vector store.
+
+        Returns:
+            The entries.
+        """
+        return await self._get_store(self.query_router(text)).retrieve(text, self._merge_options(options))
+
+    @traceable
+    async def retrieve_batch(
+        self,
+        texts: list[str],
+        options: VectorStoreOptions | None = None,
+    ) -> list[list[VectorStoreResult]]:
+        """
+        Retrieve entries most similar to each of the provided texts. The texts are grouped by the collection
+        chosen by the query router and each collection receives a single batched request.
+
+        Args:
+            texts: The texts to query the vector store with.
+            options: The options for querying the vector store, shared by all queries.
+
+        Returns:
+            The entries, one list per query text, in the same order as the texts.
+        """
+        merged_options = self._merge_options(options)
+        positions_by_collection: defaultdict[str, list[int]] = defaultdict(list)
+        for position, text in enumerate(texts):
+            positions_by_collection[self.query_router(text)].append(position)
+
+        collections = list(positions_by_collection)
+        collection_results = await asyncio.gather(
+            *(
+                self._get_store(collection).retrieve_batch(
+                    [texts[position] for position in positions_by_collection[collection]], merged_options
+                )
+                for collection in collections
+            )
+        )
+
+        results: list[list[VectorStoreResult]] = [[] for _ in texts]
+        for collection, batch_results in zip(collections, collection_results, strict=True):
+            for position, query_results in zip(positions_by_collection[collection], batch_results, strict=True):
+                results[position] = query_results
+        return results
+
+    @traceable
+    async def remove(self, ids: list[UUID]) -> None:
+        """
+        Remove entries from the vector stores of all collections.
+
+        Args:
+            ids: The list of entries' IDs to remove.
+        """
+        await asyncio.gather(*(self._get_store(collection).remove(ids) for collection in self.collections))
+
+    @traceable
+    async def list(
+        self, where: WhereQuery | None = None, limit: int | None = None, offset: int = 0
+    ) -> list[VectorStoreEntry]:
+        """
+        List entries from the vector stores of all collections, in the order the collections were provided
+        in the constructor. The entries can be filtered, limited and offset.
+
+        Args:
+            where: The filter dictionary - the keys are the field names and the values are the values to filter by.
+                Not specifying the key means no filtering.
+            limit: The maximum number of entries to return.
+            offset: The number of entries to skip.
+
+        Returns:
+            The entries.
+        """
+        results: list[VectorStoreEntry] = []
+        for collection in self.collections:
+            remaining = None if limit is None else offset + limit - len(results)
+            if remaining is not None and remaining <= 0:
+                break
+            results.extend(await self._get_store(collection).list(where, limit=remaining))
+
+        return results[offset:] if limit is None else results[offset : offset + limit]
@@ -0,0 +1,96 @@
+import pickle
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+from ragbits.core.embeddings import CachedEmbedder, Embedder, NoopEmbedder
+from ragbits.core.options import Options
+from ragbits.core.utils.config_handling import ObjectConstructionConfig
+
+
+class DimensionsOptions(Options):
+    dimensions: int | None = None
+
+
+async def test_embed_text_uses_cache() -> None:
+    embedder = NoopEmbedder(return_values=[[[0.1, 0.2]], [[0.3, 0.4]]])
+    embedder.embed_text = AsyncMock(wraps=embedder.embed_text)  # type: ignore
+    cached_embedder = CachedEmbedder(embedder)
+
+    first = await cached_embedder.embed_text(["foo", "bar"])
+    second = await cached_embedder.embed_text(["bar", "baz", "foo"])
+
+    assert first == [[0.1, 0.2], [0.1, 0.2]]
+    assert second == [[0.1, 0.2], [0.3, 0.4], [0.1, 0.2]]
+    assert embedder.embed_text.call_count == 2
+    assert embedder.embed_text.call_args_list[1].args[0] == ["baz"]
+
+
+async def test_embed_text_persists_cache(tmp_path: Path) -> None:
+    cache_path = tmp_path / "cache.db"
+    await CachedEmbedder(NoopEmbedder(return_values=[[[0.1, 0.2]]]), cache_path=cache_path).embed_text(["foo"])
+
+    embedder = NoopEmbedder(return_values=[[[0.3, 0.4]]])
+    embedder.embed_text = AsyncMock(wraps=embedder.embed_text)  # type: ignore
+    result = await CachedEmbedder(embedder, cache_path=cache_path).embed_text(["foo"])
+
+    assert result == [[0.1, 0.2]]
+    embedder.embed_text.assert_not_called()
+
+
+async def test_embed_text_separates_namespaces(tmp_path: Path) -> None:
+    cache_path = tmp_path / "cache.db"
+    await CachedEmbedder(NoopEmbedder(return_values=[[[0.1, 0.2]]]), cache_path=cache_path).embed_text(["foo"])
+
+    cached_embedder = CachedEmbedder(NoopEmbedder(return_values=[[[0.3, 0.4]]]), cache_path=cache_path, namespace="b")
+
+    assert await cached_embedder.embed_text(["foo"]) == [[0.3, 0.4]]
+
+
+async def test_embed_text_separates_embedder_default_options(tmp_path: Path) -> None:
+    cache_path = tmp_path / "cache.db"
+    small_embedder = NoopEmbedder(default_options=DimensionsOptions(dimensions=2), return_values=[[[0.1, 0.2]]])
+    await CachedEmbedder(small_embedder, cache_path=cache_path).embed_text(["foo"])
+
+    large_embedder = NoopEmbedder(default_options=DimensionsOptions(dimensions=3), return_values=[[[0.3, 0.4, 0.5]]])
+    cached_embedder = CachedEmbedder(large_embedder, cache_path=cache_path)
+
+    assert await cached_embedder.embed_text(["foo"]) == [[0.3, 0.4, 0.5]]
+
+
+async def test_embed_text_uses_default_options() -> None:
+    embedder = NoopEmbedder(return_values=[[[0.1, 0.2]], [[0.3, 0.4]]])
+    embedder.embed_text = AsyncMock(wraps=embedder.embed_text)  # type: ignore
+    cached_embedder = CachedEmbedder(embedder, default_options=DimensionsOptions(dimensions=2))
+
+    await cached_embedder.embed_text(["foo"])
+    await cached_embedder.embed_text(["foo"], options=DimensionsOptions(dimensions=3))
+
+    assert [call.args[1].dict() for call in embedder.embed_text.call_args_list] == [
+        {"dimensions": 2},
+        {"dimensions": 3},
+    ]
+
+
+def test_pickle() -> None:
+    cached_embedder = CachedEmbedder(NoopEmbedder(), namespace="test")
+    unpickled = pickle.loads(pickle.dumps(cached_embedder))  # noqa: S301
+
+    assert isinstance(unpickled, CachedEmbedder)
+    assert isinstance(unpickled.embedder, NoopEmbedder)
+    assert unpickled.namespace == "test"
+
+
+def test_subclass_from_config() -> None:
+    config = ObjectConstructionConfig.model_validate(
+        {
+            "type": "ragbits.core.embeddings.cached:CachedEmbedder",
+            "config": {
+                "embedder": {"type": "NoopEmbedder"},
+                "namespace": "test",
+            },
+        }
+    )
+    embedder: Embedder = Embedder.subclass_from_config(config)
+    assert isinstance(embedder, CachedEmbedder)
+    assert isinstance(embedder.embedder, NoopEmbedder)
+    assert embedder.namespace == "test"
@@ -0,0 +1,54 @@
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("fastembed")
+
+from ragbits.core.embeddings.fastembed import FastEmbedEmbedder, FastEmbedSparseEmbedder  # noqa: E402
+
+
+async def count_ticks_while(coroutine: asyncio.Future | asyncio.Task) -> int:
+    ticks = 0
+    while not coroutine.done():
+        await asyncio.sleep(0.01)
+        ticks += 1
+    return ticks
+
+
+def slow_dense_embed(data: list[str], **kwargs: object) -> list[list[float]]:
+    time.sleep(0.1)
+    return [[0.1, 0.2] for _ in data]
+
+
+def slow_sparse_embed(data: list[str], **kwargs: object) -> list[SimpleNamespace]:
+    time.sleep(0.1)
+    return [SimpleNamespace(values=[0.5], indices=[1]) for _ in data]
+
+
+async def test_fastembed_dense_embeddings_do_not_block_event_loop():
+    with patch("ragbits.core.embeddings.fastembed.TextEmbedding") as text_embedding:
+        text_embedding.return_value.embed.side_effect = slow_dense_embed
+        embedder = FastEmbedEmbedder("test-model")
+
+    task = asyncio.create_task(embedder.embed_text(["text1", "text2"]))
+    ticks = await count_ticks_while(task)
+
+    assert await task == [[0.1, 0.2], [0.1, 0.2]]
+    assert ticks > 1
+
+
+async def test_fastembed_sparse_embeddings_do_not_block_event_loop():
+    with patch("ragbits.core.embeddings.fastembed.SparseTextEmbedding") as sparse_text_embedding:
+        sparse_text_embedding.return_value.embed.side_effect = slow_sparse_embed
+        embedder = FastEmbedSparseEmbedder("test-model")
+
+    task = asyncio.create_task(embedder.embed_text(["text1"]))
+    ticks = await count_ticks_while(task)
+
+    result = await task
+    assert result[0].values == [0.5]
+    assert result[0].indices == [1]
+    assert ticks > 1
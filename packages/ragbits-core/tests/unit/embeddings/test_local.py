@@ -0,0 +1,33 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+from ragbits.core.embeddings.local import LocalEmbedder, LocalEmbedderOptions  # noqa: E402
+
+
+def slow_embed_batch(self: LocalEmbedder, batch: list[str]) -> list[list[float]]:
+    time.sleep(0.1)
+    return [[0.1, 0.2] for _ in batch]
+
+
+async def test_local_embeddings_do_not_block_event_loop():
+    with (
+        patch("ragbits.core.embeddings.local.AutoModel"),
+        patch("ragbits.core.embeddings.local.AutoTokenizer"),
+    ):
+        embedder = LocalEmbedder("test-model", default_options=LocalEmbedderOptions(batch_size=2))
+
+    with patch.object(LocalEmbedder, "_embed_batch", slow_embed_batch):
+        task = asyncio.create_task(embedder.embed_text(["text1", "text2", "text3"]))
+        ticks = 0
+        while not task.done():
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+        assert await task == [[0.1, 0.2]] * 3
+    assert ticks > 1
@@ -1,3 +1,6 @@
+import asyncio
+import pickle
+
 import pytest
 from pydantic import BaseModel
 
@@ -146,3 +149,59 @@ def test_output_schema():
 def test_has_images():
     prompt = SimplePrompt("Hello")
     assert len(prompt.list_images()) == 0
+
+
+class SlowMockLLM(MockLLM):
+    def __init__(self, concurrency_limit: int | None) -> None:
+        super().__init__(concurrency_limit=concurrency_limit)
+        self.running = 0
+        self.max_running = 0
+
+    async def _call(self, *args, **kwargs) -> dict:  # type: ignore
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        return await super()._call(*args, **kwargs)
+
+
+@pytest.mark.parametrize(("concurrency_limit", "expected_max_running"), [(2, 2), (None, 5)])
+async def test_generate_concurrency_limit(concurrency_limit: int | None, expected_max_running: int):
+    llm = SlowMockLLM(concurrency_limit=concurrency_limit)
+    responses = await asyncio.gather(*[llm.generate("Hello") for _ in range(5)])
+    assert responses == ["mocked response"] * 5
+    assert llm.max_running == expected_max_running
+
+
+def test_generate_concurrency_limit_in_multiple_event_loops():
+    llm = SlowMockLLM(concurrency_limit=1)
+
+    async def generate_concurrently() -> list[str]:
+        return await asyncio.gather(*[llm.generate("Hello") for _ in range(2)])
+
+    assert asyncio.run(generate_concurrently()) == ["mocked response"] * 2
+    assert asyncio.run(generate_concurrently()) == ["mocked response"] * 2
+    assert llm.max_running == 1
+
+
+async def test_pickle_after_concurrency_limited_generate():
+    llm = SlowMockLLM(concurrency_limit=1)
+    await asyncio.gather(*[llm.generate("Hello") for _ in range(2)])
+
+    unpickled = pickle.loads(pickle.dumps(llm))  # noqa: S301
+
+    assert await unpickled.generate("Hello") == "mocked response"
+    assert unpickled.concurrency_limit == 1
+
+
+async def test_generate_streaming_releases_slot_when_closed_early():
+    llm = MockLLM(concurrency_limit=1)
+
+    async for _ in llm.generate_streaming("Hello", options=MockLLMOptions(response_stream=["a", "b"])):
+        break
+    stream = llm.generate_streaming("Hello", options=MockLLMOptions(response_stream=["a", "b"]))
+    async for _ in stream:
+        break
+    await stream.aclose()
+
+    assert await asyncio.wait_for(llm.generate("Hello"), timeout=1) == "mocked response"
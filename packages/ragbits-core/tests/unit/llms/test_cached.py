@@ -0,0 +1,128 @@
+import asyncio
+import pickle
+from unittest.mock import AsyncMock
+
+from pydantic import BaseModel
+
+from ragbits.core.embeddings.noop import NoopEmbedder
+from ragbits.core.llms.cached import CachedLLM
+from ragbits.core.llms.mock import MockLLM, MockLLMOptions
+from ragbits.core.prompt.base import BasePrompt
+from ragbits.core.vector_stores.in_memory import InMemoryVectorStore
+
+
+class SlowMockLLM(MockLLM):
+    async def _call(
+        self,
+        prompt: BasePrompt,
+        options: MockLLMOptions,
+        json_mode: bool = False,
+        output_schema: type[BaseModel] | dict | None = None,
+    ) -> dict:
+        await asyncio.sleep(0.01)
+        return await super()._call(prompt, options, json_mode, output_schema)
+
+
+async def test_cached_llm_reuses_response_for_identical_request():
+    llm = MockLLM(default_options=MockLLMOptions(response="cached response"))
+    cached_llm = CachedLLM(llm)
+
+    first = await cached_llm.generate("Hello")
+    second = await cached_llm.generate("Hello")
+
+    assert first == second == "cached response"
+    assert len(llm.calls) == 1
+
+
+async def test_cached_llm_reuses_response_for_identical_request_in_flight():
+    llm = SlowMockLLM(default_options=MockLLMOptions(response="cached response"))
+    cached_llm = CachedLLM(llm)
+
+    responses = await asyncio.gather(*(cached_llm.generate("Hello") for _ in range(3)))
+
+    assert responses == ["cached response"] * 3
+    assert len(llm.calls) == 1
+    assert not cached_llm._pending
+
+
+async def test_cached_llm_calls_llm_for_different_requests():
+    llm = MockLLM()
+    cached_llm = CachedLLM(llm)
+
+    await cached_llm.generate("Hello")
+    await cached_llm.generate("Hi")
+    await cached_llm.generate("Hello", options=MockLLMOptions(response="other response"))
+
+    assert len(llm.calls) == 3
+
+
+async def test_cached_llm_evicts_least_recently_used_responses():
+    llm = MockLLM()
+    cached_llm = CachedLLM(llm, max_size=1)
+
+    await cached_llm.generate("Hello")
+    await cached_llm.generate("Hi")
+    await cached_llm.generate("Hello")
+
+    assert len(llm.calls) == 3
+
+
+async def test_cached_llm_reuses_response_for_similar_request():
+    llm = MockLLM(default_options=MockLLMOptions(response="cached response"))
+    cached_llm = CachedLLM(llm, vector_store=InMemoryVectorStore(embedder=NoopEmbedder()))
+
+    first = await cached_llm.generate("What is the capital of France?")
+    second = await cached_llm.generate("What's the capital of France?")
+
+    assert first == second == "cached response"
+    assert len(llm.calls) == 1
+
+
+async def test_cached_llm_caches_similar_request_as_identical():
+    vector_store = InMemoryVectorStore(embedder=NoopEmbedder())
+    cached_llm = CachedLLM(MockLLM(), vector_store=vector_store)
+    await cached_llm.generate("What is the capital of France?")
+    await cached_llm.generate("What's the capital of France?")
+    vector_store.retrieve = AsyncMock(wraps=vector_store.retrieve)  # type: ignore[method-assign]
+
+    await cached_llm.generate("What's the capital of France?")
+
+    vector_store.retrieve.assert_not_awaited()
+
+
+async def test_cached_llm_does_not_reuse_similar_request_with_different_context():
+    llm = MockLLM()
+    cached_llm = CachedLLM(llm, vector_store=InMemoryVectorStore(embedder=NoopEmbedder()))
+
+    await cached_llm.generate([{"role": "system", "content": "Answer in French."}, {"role": "user", "content": "Hi"}])
+    await cached_llm.generate([{"role": "system", "content": "Answer in German."}, {"role": "user", "content": "Hi"}])
+
+    assert len(llm.calls) == 2
+
+
+def test_cached_llm_from_config():
+    cached_llm = CachedLLM.from_config(
+        {
+            "llm": {"type": "ragbits.core.llms.mock:MockLLM"},
+            "vector_store": {
+                "type": "ragbits.core.vector_stores.in_memory:InMemoryVectorStore",
+                "config": {"embedder": {"type": "ragbits.core.embeddings.noop:NoopEmbedder"}},
+            },
+            "max_size": 10,
+        }
+    )
+
+    assert isinstance(cached_llm.llm, MockLLM)
+    assert isinstance(cached_llm.vector_store, InMemoryVectorStore)
+    assert cached_llm.max_size == 10
+
+
+async def test_cached_llm_pickles_without_requests_in_flight():
+    cached_llm = CachedLLM(SlowMockLLM())
+    task = asyncio.create_task(cached_llm.generate("Hello"))
+    await asyncio.sleep(0)
+
+    restored = pickle.loads(pickle.dumps(cached_llm))  # noqa: S301
+
+    assert restored._pending == {}
+    await task
@@ -1,3 +1,6 @@
+import pickle
+from copy import deepcopy
+
 import pytest
 
 from ragbits.core.options import Options
@@ -38,3 +41,18 @@ def test_merge_options() -> None:
     merged = options_a | options_b | options_c
 
     assert merged.dict() == {"a": 2, "b": 2, "c": "c", "d": None, "e": None}
+
+
+def test_merge_options_skips_not_given() -> None:
+    merged = OptionA(a=3, d=4) | OptionA(d=NOT_GIVEN) | OptionsC(c="d")
+
+    assert merged.dict() == {"a": 2, "c": "d", "d": 4}
+
+
+def test_merge_copied_options_skips_not_given() -> None:
+    pickled = pickle.loads(pickle.dumps(OptionA(d=NOT_GIVEN)))  # noqa: S301
+    copied = deepcopy(OptionA(d=NOT_GIVEN))
+
+    assert pickled.d is NOT_GIVEN
+    assert copied.d is NOT_GIVEN
+    assert (OptionA(d=4) | pickled | copied).dict() == {"a": 1, "d": 4}
@@ -104,7 +104,9 @@ async def test_retrieve(
         "ids": [ids],
     }
 
-    query_results = await mock_chromadb_store.retrieve("query", options=VectorStoreOptions(max_distance=max_distance))
+    query_results = await mock_chromadb_store.retrieve(
+        "query", options=VectorStoreOptions(max_distance=max_distance, include_vectors=True)
+    )
 
     assert len(query_results) == len(results)
     for query_result, result in zip(query_results, results, strict=True):
@@ -96,6 +96,30 @@ def test_subclass_from_config_qdrant_client():
     assert isinstance(store._client.init_options["limits"], httpx.Limits)
     assert store._client.init_options["limits"].keepalive_expiry == 20
     assert store._client.init_options["limits"].max_keepalive_connections == 0
+    assert store._client.init_options["limits"].max_connections == 1000
     assert isinstance(store._client._client, AsyncQdrantLocal)
     assert store.default_options.k == 10
     assert store.default_options.max_distance == 0.22
+
+
+def test_subclass_from_config_qdrant_client_default_limits():
+    config = ObjectConstructionConfig.model_validate(
+        {
+            "type": "ragbits.core.vector_stores.qdrant:QdrantVectorStore",
+            "config": {
+                "client": {
+                    "type": "AsyncQdrantClient",
+                    "config": {"location": ":memory:"},
+                },
+                "index_name": "some_index",
+                "embedder": {"type": "NoopEmbedder"},
+            },
+        }
+    )
+    store = VectorStore.subclass_from_config(config)  # type: ignore
+    assert isinstance(store, QdrantVectorStore)
+    assert store._client.init_options["limits"] == httpx.Limits(
+        max_connections=1000,
+        max_keepalive_connections=200,
+        keepalive_expiry=30,
+    )
@@ -1,10 +1,12 @@
 from pathlib import Path
+from unittest.mock import AsyncMock
+from uuid import uuid4
 
 import pytest
 from pydantic import computed_field
 
 from ragbits.core.embeddings.noop import NoopEmbedder
-from ragbits.core.vector_stores.base import EmbeddingType, VectorStoreOptions
+from ragbits.core.vector_stores.base import EmbeddingType, VectorStoreEntry, VectorStoreOptions
 from ragbits.core.vector_stores.in_memory import InMemoryVectorStore
 from ragbits.document_search.documents.document import DocumentMeta, DocumentType
 from ragbits.document_search.documents.element import Element
@@ -188,6 +190,14 @@ async def test_retrieve(store: InMemoryVectorStore, k: int, max_distance: float
         assert query_result.entry.metadata["name"] == result
 
 
+async def test_retrieve_batch(store: InMemoryVectorStore) -> None:
+    batch_results = await store.retrieve_batch(["query 0", "query 1"], options=VectorStoreOptions(k=2))
+
+    assert len(batch_results) == 2
+    for query_results in batch_results:
+        assert [result.entry.metadata["name"] for result in query_results] == ["spikey", "fluffy"]
+
+
 async def test_remove(store: InMemoryVectorStore) -> None:
     entries = await store.list()
     entry_number = len(entries)
@@ -270,3 +280,23 @@ async def test_where_limit(store: InMemoryVectorStore) -> None:
 
     assert len(results) == 1
     assert results[0].metadata["name"] == "hairy"
+
+
+async def test_store_embeds_duplicated_texts_once() -> None:
+    embedder = NoopEmbedder(return_values=[[[0.1, 0.1], [0.2, 0.2]]])
+    embedder.embed_text = AsyncMock(wraps=embedder.embed_text)  # type: ignore
+    store = InMemoryVectorStore(embedder=embedder)
+    entries = [
+        VectorStoreEntry(id=uuid4(), text="dog"),
+        VectorStoreEntry(id=uuid4(), text="cat"),
+        VectorStoreEntry(id=uuid4(), text="dog"),
+    ]
+
+    await store.store(entries)
+
+    embedder.embed_text.assert_called_once_with(["dog", "cat"])
+    assert store._embeddings == {
+        entries[0].id: [0.1, 0.1],
+        entries[1].id: [0.2, 0.2],
+        entries[2].id: [0.1, 0.1],
+    }
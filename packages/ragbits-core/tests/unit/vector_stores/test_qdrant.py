@@ -1,5 +1,6 @@
+import asyncio
 from unittest.mock import AsyncMock
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import pytest
 from pydantic import ValidationError
@@ -7,16 +8,19 @@ from qdrant_client.http import models
 
 from ragbits.core.embeddings.noop import NoopEmbedder
 from ragbits.core.utils.pydantic import _pydantic_bytes_to_hex
-from ragbits.core.vector_stores.base import VectorStoreEntry
-from ragbits.core.vector_stores.qdrant import QdrantVectorStore
+from ragbits.core.vector_stores.base import VectorStoreEntry, VectorStoreOptions
+from ragbits.core.vector_stores.qdrant import QdrantVectorStore, _qdrant_filter_template
+
+QUANTIZATION_CONFIG = models.ScalarQuantization(scalar=models.ScalarQuantizationConfig(type=models.ScalarType.INT8))
 
 
 @pytest.fixture
-def mock_qdrant_store() -> QdrantVectorStore:
+def mock_qdrant_store(request: pytest.FixtureRequest) -> QdrantVectorStore:
     return QdrantVectorStore(
         client=AsyncMock(),
         index_name="test_collection",
         embedder=NoopEmbedder(return_values=[[[0.1, 0.2, 0.3]]], image_return_values=[[[0.7, 0.8, 0.9]]]),
+        **getattr(request, "param", {}),
     )
 
 
@@ -54,9 +58,9 @@ async def test_store(mock_qdrant_store: QdrantVectorStore) -> None:
 
     mock_qdrant_store._client.collection_exists.assert_called_once()  # type: ignore
     mock_qdrant_store._client.create_collection.assert_called_once()  # type: ignore
-    mock_qdrant_store._client.upload_points.assert_called_once()  # type: ignore
-    call_kwargs = mock_qdrant_store._client.upload_points.call_args.kwargs  # type: ignore
-    call_points = list(call_kwargs["points"])
+    mock_qdrant_store._client.upsert.assert_called_once()  # type: ignore
+    call_kwargs = mock_qdrant_store._client.upsert.call_args.kwargs  # type: ignore
+    call_points = call_kwargs["points"]
 
     assert call_kwargs["collection_name"] == "test_collection"
     assert len(call_points) == 2
@@ -91,48 +95,125 @@ async def test_store(mock_qdrant_store: QdrantVectorStore) -> None:
     }
 
 
+class EntryWithSource(VectorStoreEntry):
+    source: str
+
+
+async def test_store_keeps_subclass_fields(mock_qdrant_store: QdrantVectorStore) -> None:
+    entry = EntryWithSource(id=uuid4(), text="test_key", source="test source")
+
+    await mock_qdrant_store.store([entry])
+
+    call_points = mock_qdrant_store._client.upsert.call_args.kwargs["points"]  # type: ignore
+    assert call_points[0].payload == entry.model_dump(exclude_none=True)
+    assert call_points[0].payload["source"] == "test source"
+
+
+async def test_store_checks_collection_once(mock_qdrant_store: QdrantVectorStore) -> None:
+    mock_qdrant_store._client.collection_exists.return_value = False  # type: ignore
+    mock_qdrant_store._client.query_points.return_value = models.QueryResponse(points=[])  # type: ignore
+
+    await mock_qdrant_store.store([VectorStoreEntry(id=uuid4(), text="test_key 1")])
+    await mock_qdrant_store.store([VectorStoreEntry(id=uuid4(), text="test_key 2")])
+    await mock_qdrant_store.list(limit=10)
+
+    mock_qdrant_store._client.collection_exists.assert_called_once()  # type: ignore
+    mock_qdrant_store._client.create_collection.assert_called_once()  # type: ignore
+    assert mock_qdrant_store._client.upsert.call_count == 2  # type: ignore
+
+
+@pytest.mark.parametrize("mock_qdrant_store", [{"upload_batch_size": 2}], indirect=True)
+async def test_store_in_batches(mock_qdrant_store: QdrantVectorStore) -> None:
+    data = [VectorStoreEntry(id=uuid4(), text=f"test_key {i}") for i in range(5)]
+
+    await mock_qdrant_store.store(data)
+
+    assert mock_qdrant_store._client.upsert.call_count == 3  # type: ignore
+    batches = [call.kwargs["points"] for call in mock_qdrant_store._client.upsert.call_args_list]  # type: ignore
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [point.id for batch in batches for point in batch] == [str(entry.id) for entry in data]
+
+
+@pytest.mark.parametrize(
+    "mock_qdrant_store",
+    [{"vector_datatype": models.Datatype.FLOAT16, "quantization_config": QUANTIZATION_CONFIG}],
+    indirect=True,
+)
+async def test_store_creates_collection_with_compact_vectors(mock_qdrant_store: QdrantVectorStore) -> None:
+    mock_qdrant_store._client.collection_exists.return_value = False  # type: ignore
+
+    await mock_qdrant_store.store([VectorStoreEntry(id=uuid4(), text="test_key")])
+
+    call_kwargs = mock_qdrant_store._client.create_collection.call_args.kwargs  # type: ignore
+    assert call_kwargs["vectors_config"] == models.VectorParams(
+        size=3, distance=models.Distance.COSINE, datatype=models.Datatype.FLOAT16
+    )
+    assert call_kwargs["quantization_config"] == QUANTIZATION_CONFIG
+
+
+@pytest.mark.parametrize("mock_qdrant_store", [{"upload_batch_size": 1, "upload_max_concurrency": 2}], indirect=True)
+async def test_store_limits_upload_concurrency(mock_qdrant_store: QdrantVectorStore) -> None:
+    running = max_running = 0
+
+    async def upsert(**kwargs: object) -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    mock_qdrant_store._client.upsert.side_effect = upsert  # type: ignore
+
+    await mock_qdrant_store.store([VectorStoreEntry(id=uuid4(), text=f"test_key {i}") for i in range(5)])
+
+    assert mock_qdrant_store._client.upsert.call_count == 5  # type: ignore
+    assert max_running == 2
+
+
 async def test_retrieve(mock_qdrant_store: QdrantVectorStore) -> None:
-    mock_qdrant_store._client.query_points.return_value = models.QueryResponse(  # type: ignore
-        points=[
-            models.ScoredPoint(
-                version=1,
-                id="1f908deb-bc9f-4b5a-8b73-2e72d8b44dc5",
-                vector=[0.12, 0.25, 0.29],
-                score=0.9,
-                payload={
-                    "id": "1f908deb-bc9f-4b5a-8b73-2e72d8b44dc5",
-                    "text": "test_key 1",
-                    "metadata": {
-                        "content": "test content 1",
-                        "document_meta": {
-                            "title": "test title 1",
-                            "source": {"path": "/test/path-1"},
-                            "document_type": "txt",
+    mock_qdrant_store._client.query_batch_points.return_value = [  # type: ignore
+        models.QueryResponse(
+            points=[
+                models.ScoredPoint(
+                    version=1,
+                    id="1f908deb-bc9f-4b5a-8b73-2e72d8b44dc5",
+                    vector=[0.12, 0.25, 0.29],
+                    score=0.9,
+                    payload={
+                        "id": "1f908deb-bc9f-4b5a-8b73-2e72d8b44dc5",
+                        "text": "test_key 1",
+                        "metadata": {
+                            "content": "test content 1",
+                            "document_meta": {
+                                "title": "test title 1",
+                                "source": {"path": "/test/path-1"},
+                                "document_type": "txt",
+                            },
                         },
                     },
-                },
-            ),
-            models.ScoredPoint(
-                version=1,
-                id="827cad0b-058f-4b85-b8ed-ac741948d502",
-                vector=[0.7, 0.8, 0.9],
-                score=0.7,
-                payload={
-                    "id": "827cad0b-058f-4b85-b8ed-ac741948d502",
-                    "text": "test_key 2",
-                    "image_bytes": _pydantic_bytes_to_hex(b"image"),
-                    "metadata": {
-                        "content": "test content 2",
-                        "document_meta": {
-                            "title": "test title 2",
-                            "source": {"path": "/test/path-2"},
-                            "document_type": "txt",
+                ),
+                models.ScoredPoint(
+                    version=1,
+                    id="827cad0b-058f-4b85-b8ed-ac741948d502",
+                    vector=[0.7, 0.8, 0.9],
+                    score=0.7,
+                    payload={
+                        "id": "827cad0b-058f-4b85-b8ed-ac741948d502",
+                        "text": "test_key 2",
+                        "image_bytes": _pydantic_bytes_to_hex(b"image"),
+                        "metadata": {
+                            "content": "test content 2",
+                            "document_meta": {
+                                "title": "test title 2",
+                                "source": {"path": "/test/path-2"},
+                                "document_type": "txt",
+                            },
                         },
                     },
-                },
-            ),
-        ]
-    )
+                ),
+            ]
+        )
+    ]
 
     results = [
         {"content": "test content 1", "title": "test title 1", "vector": [0.12, 0.25, 0.29], "score": 0.9},
@@ -144,7 +225,10 @@ async def test_retrieve(mock_qdrant_store: QdrantVectorStore) -> None:
         },
     ]
 
-    query_results = await mock_qdrant_store.retrieve("query")
+    query_results = await mock_qdrant_store.retrieve("query", options=VectorStoreOptions(include_vectors=True))
+
+    call_kwargs = mock_qdrant_store._client.query_batch_points.call_args.kwargs  # type: ignore
+    assert all(request.with_vector for request in call_kwargs["requests"])
 
     assert len(query_results) == len(results)
     for query_result, result in zip(query_results, results, strict=True):
@@ -154,6 +238,74 @@ async def test_retrieve(mock_qdrant_store: QdrantVectorStore) -> None:
         assert query_result.score == result["score"]
 
 
+async def test_retrieve_batch(mock_qdrant_store: QdrantVectorStore) -> None:
+    mock_qdrant_store._client.query_batch_points.return_value = [  # type: ignore
+        models.QueryResponse(
+            points=[
+                models.ScoredPoint(
+                    version=1,
+                    id=f"1f908deb-bc9f-4b5a-8b73-2e72d8b44dc{i}",
+                    vector=[0.1, 0.2, 0.3],
+                    score=0.9,
+                    payload={"id": f"1f908deb-bc9f-4b5a-8b73-2e72d8b44dc{i}", "text": f"test_key {i}"},
+                )
+            ]
+        )
+        for i in range(3)
+    ]
+
+    query_results = await mock_qdrant_store.retrieve_batch(["query 0", "query 1", "query 2"])
+
+    mock_qdrant_store._client.query_batch_points.assert_called_once()  # type: ignore
+    call_kwargs = mock_qdrant_store._client.query_batch_points.call_args.kwargs  # type: ignore
+    assert call_kwargs["collection_name"] == "test_collection"
+    assert len(call_kwargs["requests"]) == 3
+    assert all(request.limit == 5 for request in call_kwargs["requests"])
+    assert not any(request.with_vector for request in call_kwargs["requests"])
+
+    assert len(query_results) == 3
+    for i, results in enumerate(query_results):
+        assert len(results) == 1
+        assert results[0].entry.text == f"test_key {i}"
+
+
+async def test_list_entry_types(mock_qdrant_store: QdrantVectorStore) -> None:
+    mock_qdrant_store._client.query_points.return_value = models.QueryResponse(  # type: ignore
+        points=[
+            models.ScoredPoint(
+                version=1,
+                id="827cad0b-058f-4b85-b8ed-ac741948d502",
+                score=0.7,
+                payload={
+                    "id": "827cad0b-058f-4b85-b8ed-ac741948d502",
+                    "image_bytes": _pydantic_bytes_to_hex(b"image"),
+                },
+            ),
+        ]
+    )
+
+    entries = await mock_qdrant_store.list()
+
+    assert entries == [VectorStoreEntry(id=UUID("827cad0b-058f-4b85-b8ed-ac741948d502"), image_bytes=b"image")]
+
+
+@pytest.mark.parametrize("mock_qdrant_store", [{"strict_validation": True}], indirect=True)
+async def test_list_strict_validation(mock_qdrant_store: QdrantVectorStore) -> None:
+    mock_qdrant_store._client.query_points.return_value = models.QueryResponse(  # type: ignore
+        points=[
+            models.ScoredPoint(
+                version=1,
+                id="827cad0b-058f-4b85-b8ed-ac741948d502",
+                score=0.7,
+                payload={"id": "827cad0b-058f-4b85-b8ed-ac741948d502"},
+            ),
+        ]
+    )
+
+    with pytest.raises(ValidationError):
+        await mock_qdrant_store.list()
+
+
 async def test_remove(mock_qdrant_store: QdrantVectorStore) -> None:
     ids_to_remove = [UUID("1c7d6b27-4ef1-537c-ad7c-676edb8bc8a8")]
 
@@ -265,6 +417,22 @@ def test_create_qdrant_filter_with_list() -> None:
     assert qdrant_filter.must == expected_conditions
 
 
+def test_create_qdrant_filter_reuses_template() -> None:
+    _qdrant_filter_template.cache_clear()
+    first = QdrantVectorStore._create_qdrant_filter({"a": "A", "b": {"c": 1}})  # type: ignore
+    second = QdrantVectorStore._create_qdrant_filter({"a": "B", "b": {"c": 2}})  # type: ignore
+
+    assert _qdrant_filter_template.cache_info().hits == 1
+    assert first.must == [
+        models.FieldCondition(key="metadata.a", match=models.MatchValue(value="A")),
+        models.FieldCondition(key="metadata.b.c", match=models.MatchValue(value=1)),
+    ]
+    assert second.must == [
+        models.FieldCondition(key="metadata.a", match=models.MatchValue(value="B")),
+        models.FieldCondition(key="metadata.b.c", match=models.MatchValue(value=2)),
+    ]
+
+
 def test_create_qdrant_filter_raises_error() -> None:
     wrong_where_query = {"a": "A", "b": 1.345}
     with pytest.raises(ValidationError):
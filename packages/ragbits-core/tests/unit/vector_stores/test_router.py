@@ -0,0 +1,125 @@
+import uuid
+from unittest.mock import AsyncMock
+
+import pytest
+
+from ragbits.core.embeddings.noop import NoopEmbedder
+from ragbits.core.vector_stores.base import VectorStoreEntry, VectorStoreOptions
+from ragbits.core.vector_stores.in_memory import InMemoryVectorStore
+from ragbits.core.vector_stores.router import MultiCollectionRouter
+
+
+@pytest.fixture(name="stores")
+def stores_fixture() -> dict[str, InMemoryVectorStore]:
+    return {
+        "animals": InMemoryVectorStore(embedder=NoopEmbedder()),
+        "plants": InMemoryVectorStore(embedder=NoopEmbedder()),
+    }
+
+
+@pytest.fixture(name="router")
+def router_fixture(stores: dict[str, InMemoryVectorStore]) -> MultiCollectionRouter:
+    return MultiCollectionRouter(
+        collections=list(stores),
+        store_factory=stores.__getitem__,
+        query_router=lambda text: text.split(":")[0],
+        entry_router=lambda entry: entry.metadata["collection"],
+    )
+
+
+async def test_router_store(router: MultiCollectionRouter, stores: dict[str, InMemoryVectorStore]):
+    entries = [
+        VectorStoreEntry(id=uuid.uuid4(), text="cat", metadata={"collection": "animals"}),
+        VectorStoreEntry(id=uuid.uuid4(), text="oak", metadata={"collection": "plants"}),
+        VectorStoreEntry(id=uuid.uuid4(), text="dog", metadata={"collection": "animals"}),
+    ]
+
+    await router.store(entries)
+
+    assert {entry.text for entry in await stores["animals"].list()} == {"cat", "dog"}
+    assert {entry.text for entry in await stores["plants"].list()} == {"oak"}
+    assert len(await router.list()) == 3
+
+
+async def test_router_retrieve_batch_queries_each_collection_once(router: MultiCollectionRouter):
+    animals_store = AsyncMock()
+    animals_store.retrieve_batch.return_value = [["a0"], ["a1"]]
+    plants_store = AsyncMock()
+    plants_store.retrieve_batch.return_value = [["p0"]]
+    router.store_factory = {"animals": animals_store, "plants": plants_store}.__getitem__
+    options = VectorStoreOptions(k=1)
+
+    results = await router.retrieve_batch(["animals:cat", "plants:oak", "animals:dog"], options)
+
+    assert results == [["a0"], ["p0"], ["a1"]]
+    animals_store.retrieve_batch.assert_awaited_once_with(["animals:cat", "animals:dog"], options)
+    plants_store.retrieve_batch.assert_awaited_once_with(["plants:oak"], options)
+
+
+@pytest.mark.parametrize(
+    ("router_options", "expected_count"),
+    [(None, 8), (VectorStoreOptions(k=3), 3)],
+)
+async def test_router_keeps_store_default_options(router_options: VectorStoreOptions | None, expected_count: int):
+    store = InMemoryVectorStore(embedder=NoopEmbedder(), default_options=VectorStoreOptions(k=10, include_vectors=True))
+    await store.store([VectorStoreEntry(id=uuid.uuid4(), text=f"animal {i}") for i in range(8)])
+    router = MultiCollectionRouter(
+        collections=["animals"],
+        store_factory=lambda collection: store,
+        query_router=lambda text: "animals",
+        entry_router=lambda entry: "animals",
+        default_options=router_options,
+    )
+
+    results = await router.retrieve("cat")
+    batch_results = await router.retrieve_batch(["cat"])
+
+    for query_results in [results, *batch_results]:
+        assert len(query_results) == expected_count
+        assert all(result.vector is not None for result in query_results)
+
+
+async def test_router_list_limits_store_queries():
+    animals_store = AsyncMock()
+    animals_store.list.return_value = [VectorStoreEntry(id=uuid.uuid4(), text="cat")]
+    plants_store = AsyncMock()
+    plants_store.list.return_value = [VectorStoreEntry(id=uuid.uuid4(), text="oak")]
+    stores = {"animals": animals_store, "plants": plants_store}
+    router = MultiCollectionRouter(
+        collections=list(stores),
+        store_factory=stores.__getitem__,
+        query_router=lambda text: text,
+        entry_router=lambda entry: entry.text or "",
+    )
+
+    entries = await router.list(limit=2, offset=1)
+
+    assert [entry.text for entry in entries] == ["oak"]
+    animals_store.list.assert_awaited_once_with(None, limit=3)
+    plants_store.list.assert_awaited_once_with(None, limit=2)
+
+
+async def test_router_evicts_least_recently_used_store():
+    factory_calls = []
+
+    def factory(collection: str) -> InMemoryVectorStore:
+        factory_calls.append(collection)
+        return InMemoryVectorStore(embedder=NoopEmbedder())
+
+    router = MultiCollectionRouter(
+        collections=["a", "b", "c"],
+        store_factory=factory,
+        query_router=lambda text: text,
+        entry_router=lambda entry: entry.text or "",
+        max_cached_stores=2,
+    )
+
+    for text in ["a", "b", "a", "c", "a", "b"]:
+        await router.retrieve(text)
+
+    assert factory_calls == ["a", "b", "c", "b"]
+
+
+async def test_router_unknown_collection(router: MultiCollectionRouter):
+    with pytest.raises(ValueError):
+        await router.retrieve("fungi:mushroom")
@@ -193,14 +193,11 @@ class DocumentSearch(WithConstructionConfig):
         config = config or SearchConfig()
         queries = await self.query_rephraser.rephrase(query)
         with trace(queries=queries, config=config, vectore_store=self.vector_store, reranker=self.reranker) as outputs:
-            elements = []
-
-            for rephrased_query in queries:
-                results = await self.vector_store.retrieve(
-                    text=rephrased_query,
-                    options=VectorStoreOptions(**config.vector_store_kwargs),
-                )
-                elements.append([Element.from_vector_db_entry(result.entry) for result in results])
+            batch_results = await self.vector_store.retrieve_batch(
+                texts=queries,
+                options=VectorStoreOptions(**config.vector_store_kwargs),
+            )
+            elements = [[Element.from_vector_db_entry(result.entry) for result in results] for results in batch_results]
 
             outputs.search_results = await self.reranker.rerank(
                 elements=elements,
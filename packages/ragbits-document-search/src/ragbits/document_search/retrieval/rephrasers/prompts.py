@@ -62,7 +62,7 @@ class MultiQueryRephraserPrompt(Prompt[MultiQueryRephraserInput, list]):
 
     @staticmethod
     def _list_parser(value: str) -> list[str]:
-        return value.split("\n")
+        return [query for line in value.splitlines() if (query := line.strip())]
 
     response_parser = _list_parser
 
@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock
 import pytest
 
 from ragbits.core.embeddings.noop import NoopEmbedder
+from ragbits.core.vector_stores.base import VectorStoreResult
 from ragbits.core.vector_stores.in_memory import InMemoryVectorStore
 from ragbits.document_search import DocumentSearch
 from ragbits.document_search._main import SearchConfig
@@ -135,6 +136,35 @@ async def test_document_search_with_search_config():
     assert cast(TextElement, results[0]).content == "Name of Peppa's brother is George"
 
 
+async def test_document_search_retrieves_rephrased_queries_in_one_batch():
+    document_meta = DocumentMeta.create_text_document_from_literal("Name of Peppa's brother is George")
+    elements = [TextElement(document_meta=document_meta, content=f"content {i}") for i in range(3)]
+    vector_store = AsyncMock()
+    vector_store.retrieve_batch.return_value = [
+        [VectorStoreResult(entry=elements[0].to_vector_db_entry(), score=0.1)],
+        [
+            VectorStoreResult(entry=elements[1].to_vector_db_entry(), score=0.2),
+            VectorStoreResult(entry=elements[2].to_vector_db_entry(), score=0.3),
+        ],
+    ]
+    query_rephraser = AsyncMock()
+    query_rephraser.rephrase.return_value = ["Peppa's brother", "George's sister"]
+    reranker = AsyncMock()
+    document_search = DocumentSearch(vector_store=vector_store, query_rephraser=query_rephraser, reranker=reranker)
+
+    await document_search.search("Peppa's brother", config=SearchConfig(vector_store_kwargs={"k": 2}))
+
+    vector_store.retrieve.assert_not_called()
+    vector_store.retrieve_batch.assert_awaited_once()
+    assert vector_store.retrieve_batch.call_args.kwargs["texts"] == ["Peppa's brother", "George's sister"]
+    assert vector_store.retrieve_batch.call_args.kwargs["options"].k == 2
+    reranked_elements = reranker.rerank.call_args.kwargs["elements"]
+    assert [[cast(TextElement, element).content for element in results] for results in reranked_elements] == [
+        ["content 0"],
+        ["content 1", "content 2"],
+    ]
+
+
 async def test_document_search_ingest_multiple_from_sources():
     document_search = DocumentSearch.from_config(CONFIG)
     examples_files = Path(__file__).parent / "example_files"
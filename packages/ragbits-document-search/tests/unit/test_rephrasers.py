@@ -95,3 +95,9 @@ def test_subclass_from_config_multiquery_llm_prompt():
     assert isinstance(rephraser._llm, LiteLLM)
     assert rephraser._n == 4
     assert issubclass(rephraser._prompt, MultiQueryRephraserPrompt)
+
+
+def test_multiquery_prompt_response_parser_skips_blank_lines():
+    response = "first query\n\n  second query  \r\n\nthird query\n"
+
+    assert MultiQueryRephraserPrompt._list_parser(response) == ["first query", "second query", "third query"]
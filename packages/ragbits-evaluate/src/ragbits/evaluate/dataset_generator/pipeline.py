@@ -50,11 +50,13 @@ class DatasetGenerationPipelineConfig(BaseModel):
         name (str): The name of the dataset generation pipeline.
         input_name (str): The name of the input resource or dataset.
         tasks (list[TaskConfig]): A list of task configurations included in the pipeline.
+        use_cache (bool): Whether to reuse the batches cached by an interrupted run of the pipeline. Defaults to False.
     """
 
     name: str
     input_name: str
     tasks: list[TaskConfig]
+    use_cache: bool = False
 
     @classmethod
     def from_dict_config(cls, dict_config: DictConfig) -> "DatasetGenerationPipelineConfig":
@@ -82,7 +84,8 @@ class DatasetGenerationPipelineConfig(BaseModel):
             )
             for task_config in dict_config.tasks
         ]
-        return cls(name=name, input_name=input_name, tasks=tasks)
+        use_cache = dict_config.get("use_cache", False)
+        return cls(name=name, input_name=input_name, tasks=tasks, use_cache=use_cache)
 
 
 class DatasetGenerationPipeline:
@@ -111,7 +114,7 @@ class DatasetGenerationPipeline:
             dataset instance
         """
         dataset = Dataset.from_dict({self.config.input_name: corpus})
-        distiset = self.pipeline.run(use_cache=False, dataset=dataset)
+        distiset = self.pipeline.run(use_cache=self.config.use_cache, dataset=dataset)
         result = distiset["default"]["train"]
         result = result.remove_columns(["distilabel_metadata", "model_name"])
         return result
@@ -1,9 +1,13 @@
+import hashlib
+import json
 import sys
 from abc import ABC, abstractmethod
 from typing import Any
 
 from distilabel.llms.base import LLM
+from distilabel.steps.base import StepInput
 from distilabel.steps.tasks import TextGeneration
+from distilabel.steps.typing import StepOutput
 
 from ragbits.core.prompt import ChatFormat, Prompt
 from ragbits.core.utils.config_handling import import_by_path
@@ -12,13 +16,24 @@ module = sys.modules[__name__]
 
 
 class BaseDistilabelTask(TextGeneration, ABC):
-    """Base class for distilabel TextGeneration tasks"""
+    """
+    Base class for distilabel TextGeneration tasks. The outputs are cached by the prompt class and the hash of
+    the input fields, so repeated inputs (e.g. the same chunk) are sent to the LLM only once per run.
+    """
 
-    def __init__(self, llm: LLM, inputs: list[str], outputs: list[str], prompt_class: str | type[Prompt]):
-        super().__init__(llm=llm)
+    def __init__(
+        self,
+        llm: LLM,
+        inputs: list[str],
+        outputs: list[str],
+        prompt_class: str | type[Prompt],
+        input_batch_size: int = 50,
+    ):
+        super().__init__(llm=llm, input_batch_size=input_batch_size)
         self._inputs = inputs
         self._outputs = outputs
         self._prompt_class = import_by_path(prompt_class, module) if isinstance(prompt_class, str) else prompt_class
+        self._outputs_cache: dict[tuple[str, str], dict[str, Any]] = {}
 
     @property
     def inputs(self) -> list[str]:
@@ -38,6 +53,46 @@ class BaseDistilabelTask(TextGeneration, ABC):
         """
         return self._outputs
 
+    def process(self, inputs: StepInput) -> StepOutput:  # type: ignore
+        """
+        Generates the outputs for a batch of inputs, reusing the outputs cached for the inputs already processed.
+        Only the first of the repeated inputs within the batch is sent to the LLM.
+
+        Args:
+            inputs: The batch of inputs.
+
+        Yields:
+            The batch of outputs, one per input.
+        """
+        if self.num_generations > 1 and not self.group_generations:
+            yield from super().process(inputs)
+            return
+
+        keys = [self._cache_key(input) for input in inputs]
+        missing: dict[tuple[str, str], dict[str, Any]] = {}
+        for key, input in zip(keys, inputs, strict=True):
+            if key not in self._outputs_cache:
+                missing.setdefault(key, input)
+
+        if missing:
+            for outputs in super().process(list(missing.values())):
+                self._outputs_cache.update(zip(missing, outputs, strict=True))
+
+        yield [{**self._outputs_cache[key], **input} for key, input in zip(keys, inputs, strict=True)]
+
+    def _cache_key(self, input: dict[str, Any]) -> tuple[str, str]:
+        """
+        Returns the key of the cached outputs for the input.
+
+        Args:
+            input: A dictionary with the input fields of the task.
+
+        Returns:
+            The path of the prompt class and the hash of the input fields.
+        """
+        input_hash = hashlib.sha256(json.dumps([input[name] for name in self.inputs]).encode()).hexdigest()
+        return f"{self._prompt_class.__module__}:{self._prompt_class.__qualname__}", input_hash
+
     def format_input(self, input: dict[str, Any]) -> ChatFormat:
         """
         Formats the input data for generating a question based on the provided "chunk".
@@ -11,8 +11,14 @@ class QueryGenTask(BaseDistilabelTask):
     A task for generating a question based on a provided text chunk.
     """
 
-    def __init__(self, llm: LLM, prompt_class: str):
-        super().__init__(llm=llm, inputs=["chunk"], outputs=["question", "chunk"], prompt_class=prompt_class)
+    def __init__(self, llm: LLM, prompt_class: str, input_batch_size: int = 50):
+        super().__init__(
+            llm=llm,
+            inputs=["chunk"],
+            outputs=["question", "chunk"],
+            prompt_class=prompt_class,
+            input_batch_size=input_batch_size,
+        )
 
     def format_output(self, output: str, input: dict[str, Any] | None = None) -> dict[str, str | list[str]]:  # noqa: PLR6301
         """
@@ -35,12 +41,13 @@ class PassagesGenTask(BaseDistilabelTask):
 
     should_get_matches: bool = False
 
-    def __init__(self, llm: LLM, prompt_class: str):
+    def __init__(self, llm: LLM, prompt_class: str, input_batch_size: int = 50):
         super().__init__(
             llm=llm,
             inputs=["chunk", "question", "basic_answer"],
             outputs=["question", "chunk", "passages"],
             prompt_class=prompt_class,
+            input_batch_size=input_batch_size,
         )
 
     def format_output(self, output: str, input: dict[str, Any] | None = None) -> dict[str, str | list[str]]:
@@ -79,8 +86,14 @@ class AnswerGenTask(BaseDistilabelTask):
     the `TextGeneration` task from the `distilabel` package.
     """
 
-    def __init__(self, llm: LLM, prompt_class: str):
-        super().__init__(llm=llm, inputs=["chunk", "question"], outputs=["basic_answer"], prompt_class=prompt_class)
+    def __init__(self, llm: LLM, prompt_class: str, input_batch_size: int = 50):
+        super().__init__(
+            llm=llm,
+            inputs=["chunk", "question"],
+            outputs=["basic_answer"],
+            prompt_class=prompt_class,
+            input_batch_size=input_batch_size,
+        )
 
     def format_output(self, output: str, input: dict[str, Any] | None = None) -> dict[str, str | list[str]]:  # noqa: PLR6301
         """
@@ -13,11 +13,26 @@ def get_closest_substring(long: str, short: str) -> str:
         short: str - shorter string
     Returns:
         closest substring of longer
+    Raises:
+        ValueError: if less than two words of the shorter string are found in the longer one
     """
-    a, b = max(
-        combinations(re.finditer("|".join(short.split()), long), 2),
-        key=lambda c: SequenceMatcher(None, long[c[0].start() : c[1].end()], short).ratio(),
-    )
+    matches = list(re.finditer("|".join(re.escape(word) for word in short.split()), long))
+    # the matcher caches the analysis of its second sequence, so it is built once for the shorter string
+    matcher = SequenceMatcher(None, "", short)
+    best_match, best_ratio = None, -1.0
+
+    for a, b in combinations(matches, 2):
+        matcher.set_seq1(long[a.start() : b.end()])
+        # cheap upper bounds of the ratio allow to skip candidates which can't beat the best one
+        if matcher.real_quick_ratio() <= best_ratio or matcher.quick_ratio() <= best_ratio:
+            continue
+        if (ratio := matcher.ratio()) > best_ratio:
+            best_match, best_ratio = (a, b), ratio
+
+    if best_match is None:
+        raise ValueError("Not enough words of the shorter string found in the longer one.")
+
+    a, b = best_match
     return long[a.start() : b.end()]
 
 